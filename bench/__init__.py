@@ -0,0 +1 @@
+"""Benchmarks of the Lumioo integration."""
@@ -0,0 +1,67 @@
+"""Benchmark the import of the Lumioo integration.
+
+Usage: python -m bench.import_time
+
+Each module is imported in a fresh interpreter, after the Home Assistant
+modules it relies on, so only the cost of the integration is measured. The
+lumioo client library and NumPy must not be loaded by these imports, the
+benchmark fails if they are.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import subprocess
+import sys
+
+MODULES = ["custom_components.lumioo", "custom_components.lumioo.config_flow"]
+# Libraries only loaded when a plant is set up
+LAZY_MODULES = ["lumioo", "numpy"]
+ROUNDS = 5
+
+SNIPPET = """
+import json, sys, time
+import homeassistant.config_entries, homeassistant.helpers.update_coordinator
+start = time.perf_counter()
+import {module}
+duration = time.perf_counter() - start
+print(json.dumps({{
+    "duration": duration,
+    "loaded": [name for name in {lazy_modules!r} if name in sys.modules],
+}}))
+"""
+
+
+def _time_import(module: str) -> tuple[float, list[str]]:
+    """Import a module in a new interpreter, return its duration and leaks."""
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            SNIPPET.format(module=module, lazy_modules=LAZY_MODULES),
+        ],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).parents[1],
+        text=True,
+    ).stdout
+    result = json.loads(output)
+    return result["duration"], result["loaded"]
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    leaks = False
+    print(f"{'module':<40} {'import ms':>9}  eagerly loaded")
+    for module in MODULES:
+        runs = [_time_import(module) for _ in range(ROUNDS)]
+        duration = min(duration for duration, _ in runs)
+        loaded = sorted({name for _, names in runs for name in names})
+        leaks = leaks or bool(loaded)
+        print(f"{module:<40} {duration * 1000:>9.1f}  {', '.join(loaded) or '-'}")
+    if leaks:
+        sys.exit("Lazily loaded libraries are imported with the integration")
+
+
+if __name__ == "__main__":
+    main()
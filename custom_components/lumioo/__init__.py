@@ -1,20 +1,32 @@
 """The Lumioo integration."""
 from __future__ import annotations
 
-from datetime import date, timedelta
+import asyncio
+from collections import deque
+from collections.abc import Awaitable
+from dataclasses import replace
+from datetime import date, datetime, timedelta
 import logging
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers import aiohttp_client
-from homeassistant.helpers.dispatcher import dispatcher_send
-from homeassistant.helpers.event import async_track_time_interval
-
-# from homeassistant.util import Throttle
-# from homeassistant.helpers.debounce import Debouncer
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryError, ConfigEntryNotReady
+from homeassistant.helpers import (
+    aiohttp_client,
+    device_registry as dr,
+    entity_registry as er,
+    issue_registry as ir,
+)
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.importlib import async_import_module
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+from homeassistant.util.ssl import get_default_context
 
 from .const import (
     DOMAIN,
@@ -24,16 +36,49 @@ from .const import (
     COORDINATOR_TRACKERS,
     COORDINATOR_METER,
     UPDATE_LISTENER,
-    # DEBOUNCE_COOLDOWN,
+    CONF_PLANT_ID,
+    CONF_REFRESH_COOLDOWN,
+    CONF_SOLAR_CROSS_CHECK,
+    SOLAR_DEVICE_IDENTIFIER,
+    DEBOUNCE_COOLDOWN,
+    MAX_CONCURRENT_REQUESTS,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_CONNECT_TIMEOUT,
+    SOLAR_TIMES_TOLERANCE,
+    ENDPOINT_TIMEOUT,
+    REFRESH_DEADLINE,
+    TRACKER_SAMPLES_CACHE_SIZE,
+    FORECAST_ACCURACY_SAVE_DELAY,
+    FORECAST_ACCURACY_STORAGE_VERSION,
+)
+from .accuracy import WINDOW_AFTERNOON, WINDOW_MORNING, ForecastAccuracy
+from .models import (
+    EnergyDaySnapshot,
+    MeterSnapshot,
+    PlantSnapshot,
+    ProductionEstimate,
+    SolarSnapshot,
+    SunSnapshot,
+    TrackerSnapshot,
 )
+from .services import async_setup_services
+from .solar_position import SolarTimes, solar_elevation, solar_times
+from .util import as_datetime
 
 import aiohttp
-from lumioo.auth import Auth
-from lumioo.core import LumiooHubAPI
+from aiohttp.hdrs import ACCEPT_ENCODING, USER_AGENT
+
+if TYPE_CHECKING:
+    from .analysis import TrackerAnalysis, TrackerAnalyzer
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+_T = TypeVar("_T")
+
+PLATFORMS: list[Platform] = [Platform.BINARY_SENSOR, Platform.SENSOR]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 MIN_TIME_BETWEEN_UPDATES = timedelta(minutes=4)
 SCAN_INTERVAL_PLANT = timedelta(minutes=1)
@@ -42,15 +87,19 @@ SCAN_INTERVAL_TRACKERS = timedelta(minutes=1)
 SCAN_INTERVAL_METER = timedelta(minutes=1)
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Lumioo services."""
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Lumioo from a config entry."""
 
     hass.data.setdefault(DOMAIN, {})
 
-    lumiooconnector = LumiooConnector(hass, entry.data["access_token"], 2180)
-
     try:
-        await lumiooconnector.setup()
+        data = await _async_create_connector(hass, entry)
     except KeyError:
         _LOGGER.error("Failed to login to lumioo")
         return False
@@ -60,6 +109,124 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except Exception as err:
         raise ConfigEntryNotReady from err
 
+    lumiooconnector = data[DATA]
+    # Entries created before plant selection monitor the first plant of the
+    # account, known once the connector is set up
+    plant_id = lumiooconnector.plant_id
+    if entry.data.get(CONF_PLANT_ID) is None:
+        try:
+            _async_store_plant_id(hass, entry, plant_id)
+        except ConfigEntryError:
+            await lumiooconnector.async_close()
+            raise
+    await _async_migrate_solar_device(hass, entry, plant_id)
+
+    async def _async_close_connector(event: Event) -> None:
+        await lumiooconnector.async_close()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_connector)
+    )
+
+    update_listener = entry.add_update_listener(_async_update_listener)
+
+    hass.data[DOMAIN][entry.entry_id] = {**data, UPDATE_LISTENER: update_listener}
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    return True
+
+
+def _duplicate_plant_issue_id(entry: ConfigEntry) -> str:
+    """Return the id of the repair issue raised for a duplicate entry."""
+    return f"duplicate_plant_{entry.entry_id}"
+
+
+@callback
+def _async_store_plant_id(hass: HomeAssistant, entry: ConfigEntry, plant_id) -> None:
+    """Store the plant monitored by an entry created before plant selection.
+
+    If another entry already monitors the plant, a repair issue asks the user
+    to remove this one and its setup fails.
+    """
+    unique_id = str(plant_id)
+    issue_id = _duplicate_plant_issue_id(entry)
+    for other in hass.config_entries.async_entries(DOMAIN):
+        if other.entry_id != entry.entry_id and other.unique_id == unique_id:
+            ir.async_create_issue(
+                hass,
+                DOMAIN,
+                issue_id,
+                is_fixable=False,
+                severity=ir.IssueSeverity.ERROR,
+                translation_key="duplicate_plant",
+                translation_placeholders={
+                    "title": entry.title,
+                    "plant_id": unique_id,
+                    "other": other.title,
+                },
+            )
+            raise ConfigEntryError(
+                f"Plant {plant_id} is already monitored by {other.title}"
+            )
+
+    ir.async_delete_issue(hass, DOMAIN, issue_id)
+    hass.config_entries.async_update_entry(
+        entry, data={**entry.data, CONF_PLANT_ID: plant_id}, unique_id=unique_id
+    )
+
+
+async def _async_migrate_solar_device(
+    hass: HomeAssistant, entry: ConfigEntry, plant_id: int
+) -> None:
+    """Move the solar device and sensors to identifiers including the plant.
+
+    They did not identify the plant before an account could have a config
+    entry per plant.
+    """
+    old_prefix = "lumioo solar "
+
+    @callback
+    def _async_migrate_unique_id(
+        entity_entry: er.RegistryEntry,
+    ) -> dict[str, Any] | None:
+        if not entity_entry.unique_id.startswith(old_prefix):
+            return None
+        key = entity_entry.unique_id.removeprefix(old_prefix)
+        return {"new_unique_id": f"lumioo {plant_id} solar {key}"}
+
+    await er.async_migrate_entries(hass, entry.entry_id, _async_migrate_unique_id)
+
+    device_registry = dr.async_get(hass)
+    device = device_registry.async_get_device(identifiers={(DOMAIN, "solar")})
+    if device is not None and entry.entry_id in device.config_entries:
+        device_registry.async_update_device(
+            device.id,
+            new_identifiers={(DOMAIN, SOLAR_DEVICE_IDENTIFIER.format(plant_id))},
+        )
+
+
+async def _async_create_connector(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Create and set up the connector and coordinators of a plant."""
+    lumiooconnector = LumiooConnector(
+        hass,
+        entry.data["access_token"],
+        entry.data.get(CONF_PLANT_ID),
+        solar_cross_check=entry.options.get(CONF_SOLAR_CROSS_CHECK, True),
+    )
+
+    try:
+        await lumiooconnector.setup()
+    except Exception:
+        await lumiooconnector.async_close()
+        raise
+
+    # Refresh requests, from the refresh service or entity updates, are
+    # collapsed into a single refresh per coordinator within the cooldown
+    refresh_cooldown = entry.options.get(CONF_REFRESH_COOLDOWN, DEBOUNCE_COOLDOWN)
+
     async def async_update_data_plant():
         _LOGGER.debug("Fetching latest data for plant")
         await lumiooconnector.update_data_plant()
@@ -86,9 +253,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         name="Lumioo Plant",
         update_method=async_update_data_plant,
         update_interval=SCAN_INTERVAL_PLANT,
-        # request_refresh_debouncer=Debouncer(
-        #    hass, _LOGGER, cooldown=DEBOUNCE_COOLDOWN, immediate=True
-        # ),
+        request_refresh_debouncer=Debouncer(
+            hass, _LOGGER, cooldown=refresh_cooldown, immediate=False
+        ),
     )
 
     coordinator_solar = DataUpdateCoordinator(
@@ -97,6 +264,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         name="Lumioo Solar",
         update_method=async_update_data_solar,
         update_interval=SCAN_INTERVAL_SOLAR,
+        request_refresh_debouncer=Debouncer(
+            hass, _LOGGER, cooldown=refresh_cooldown, immediate=False
+        ),
     )
 
     coordinator_trackers = DataUpdateCoordinator(
@@ -105,6 +275,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         name="Lumioo Trackers",
         update_method=async_update_data_trackers,
         update_interval=SCAN_INTERVAL_TRACKERS,
+        request_refresh_debouncer=Debouncer(
+            hass, _LOGGER, cooldown=refresh_cooldown, immediate=False
+        ),
     )
 
     coordinator_meter = DataUpdateCoordinator(
@@ -113,27 +286,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         name="Lumioo Meter",
         update_method=async_update_data_meter,
         update_interval=SCAN_INTERVAL_METER,
+        request_refresh_debouncer=Debouncer(
+            hass, _LOGGER, cooldown=refresh_cooldown, immediate=False
+        ),
     )
 
-    # Fetch initial data so we have data when entities subscribe
-    # await coordinator_plant.async_refresh()
-    # await coordinator_meter.async_refresh()
-
-    update_listener = entry.add_update_listener(_async_update_listener)
-
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+    return {
         DATA: lumiooconnector,
         COORDINATOR_PLANT: coordinator_plant,
         COORDINATOR_SOLAR: coordinator_solar,
         COORDINATOR_TRACKERS: coordinator_trackers,
         COORDINATOR_METER: coordinator_meter,
-        UPDATE_LISTENER: update_listener,
     }
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-
-    return True
-
 
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
@@ -143,151 +308,492 @@ async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> Non
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        data = hass.data[DOMAIN].pop(entry.entry_id)
+        await data[DATA].async_close()
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the repair issue of a removed entry."""
+    ir.async_delete_issue(hass, DOMAIN, _duplicate_plant_issue_id(entry))
+
+
 class LumiooConnector:
     """An object to store the Lumioo data."""
 
-    def __init__(self, hass: HomeAssistant, access_token, plant_id) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        access_token,
+        plant_id,
+        solar_cross_check: bool = True,
+    ) -> None:
         """Initialize Lumioo Connector."""
         self.hass = hass
         self._access_token = access_token
+        self._solar_cross_check = solar_cross_check
+        self._solar_cross_checked: date | None = None
 
-        self.auth = None
+        self._session: aiohttp.ClientSession | None = None
         self.api = None
 
         self.plant_id = plant_id
         self.main_meter_id = None
+        self.latitude = hass.config.latitude
+        self.longitude = hass.config.longitude
 
         self.plant = None
         self.trackers = None
         self.meter = None
 
-        self.data = {
-            "plant": {},
-            "solar": {},
+        # Latest tracker readings as (tracker id, snapshot), oldest first
+        self.tracker_samples: deque[tuple[str, TrackerSnapshot]] = deque(
+            maxlen=TRACKER_SAMPLES_CACHE_SIZE
+        )
+
+        self.forecast_accuracy = ForecastAccuracy()
+        self._forecast_accuracy_store: Store | None = None
+
+        self.tracker_analyzer: TrackerAnalyzer | None = None
+        self.tracker_analysis: TrackerAnalysis | None = None
+        # Position in the tracker list of the first request of the next cycle
+        self._tracker_offset = 0
+
+        # Latest published snapshots, replaced as a whole on each refresh
+        self.data: dict = {
+            "plant": None,
+            "solar": None,
+            "sun": None,
             "trackers": {},
-            "meter": {},
+            "meter": None,
+        }
+        self._version = 0
+
+        # Number of API requests issued by the latest refresh of each subsystem
+        # and by the latest export
+        self.request_counts = {
+            "plant": 0,
+            "solar": 0,
+            "trackers": 0,
+            "meter": 0,
+            "export": 0,
         }
+        self.request_total = 0
 
     async def setup(self):
         """Connect to Lumioo and fetch all datas."""
-        websession = aiohttp_client.async_get_clientsession(self.hass)
-        self.auth = Auth(websession, self._access_token)
-        self.api = LumiooHubAPI(self.auth)
+        client = await async_import_module(self.hass, f"{__package__}.client")
+        self._session = _async_create_clientsession()
+        self.api = client.create_api(self._session, self._access_token)
 
         await self.update_plant()
+        if self.trackers is None:
+            raise ConfigEntryNotReady(
+                f"Unable to fetch the details of plant {self.plant_id}"
+            )
+
+        self._forecast_accuracy_store = Store(
+            self.hass,
+            FORECAST_ACCURACY_STORAGE_VERSION,
+            f"{DOMAIN}.forecast_accuracy.{self.plant_id}",
+        )
+        if (stored := await self._forecast_accuracy_store.async_load()) is not None:
+            self.forecast_accuracy.restore(stored)
 
         await self.update_data_plant()
         await self.update_data_solar()
         await self.update_data_trackers()
         await self.update_data_meter()
+        # Entities are created from the initial plant and meter snapshots
+        if self.data["plant"] is None or self.data["meter"] is None:
+            raise ConfigEntryNotReady(
+                f"Unable to fetch the initial status of plant {self.plant_id}"
+            )
+
+    async def async_close(self):
+        """Close the HTTP connection pool used for Lumioo requests."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def async_api_call(self, data_type: str, request: Awaitable[_T]) -> _T:
+        """Await a Lumioo API request and account it to a subsystem refresh.
+
+        Exports account their requests to the export data type.
+        """
+        self.request_counts[data_type] += 1
+        self.request_total += 1
+        async with asyncio.timeout(ENDPOINT_TIMEOUT):
+            return await request
+
+    async def _async_gather_parts(
+        self, data_type: str, requests: dict[str, Awaitable[Any]]
+    ) -> tuple[dict[str, Any], frozenset[str]]:
+        """Run the requests of a refresh cycle concurrently within its deadline.
+
+        Return the results of the requests that completed, keyed like the
+        requests, and the keys of the ones that failed or were too late.
+        Requests still running at the deadline are cancelled.
+        """
+        if not requests:
+            return {}, frozenset()
+
+        tasks = {
+            name: asyncio.ensure_future(request) for name, request in requests.items()
+        }
+        _, pending = await asyncio.wait(tasks.values(), timeout=REFRESH_DEADLINE)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+            _LOGGER.warning(
+                "%d %s requests did not complete within %ss for plant %s",
+                len(pending),
+                data_type,
+                REFRESH_DEADLINE,
+                self.plant_id,
+            )
+
+        results = {}
+        stale = set()
+        for name, task in tasks.items():
+            if task in pending:
+                stale.add(name)
+                continue
+            exc = task.exception()
+            if isinstance(
+                exc, (RuntimeError, asyncio.TimeoutError, aiohttp.ClientError)
+            ):
+                _LOGGER.error(
+                    "Unable to connect to Lumioo while updating %s %s: %s",
+                    data_type,
+                    name,
+                    repr(exc),
+                )
+                stale.add(name)
+            elif exc is not None:
+                raise exc
+            else:
+                results[name] = task.result()
+        return results, frozenset(stale)
+
+    def _publish(self, previous: _T | None, snapshot: _T) -> _T:
+        """Return the snapshot to publish, with a new version if it changed."""
+        if snapshot == previous:
+            return previous
+        self._version += 1
+        return replace(snapshot, version=self._version)
 
     async def update_plant(self):
         """Update the internal data from Lumioo."""
         _LOGGER.debug("Updating plant %s", self.plant_id)
         try:
+            if self.plant_id is None:
+                plants = await self.api.async_get_plants()
+                self.plant_id = plants[0].id
             data_plant = await self.api.async_get_plant(self.plant_id)
             data_trackers = await self.api.async_get_trackers(self.plant_id)
             data_meter = await self.api.async_get_meter(data_plant.main_meter)
         except RuntimeError:
             _LOGGER.error(
-                "Unable to connect to Lumioo while updating trackers %d", self.plant_id
+                "Unable to connect to Lumioo while updating trackers %s", self.plant_id
             )
             return
 
         self.main_meter_id = data_plant.main_meter
+        # Use the plant location when the API provides it
+        self.latitude = getattr(data_plant, "latitude", None) or self.latitude
+        self.longitude = getattr(data_plant, "longitude", None) or self.longitude
 
         self.plant = data_plant
         self.trackers = data_trackers
         self.meter = data_meter
 
+        analysis = await async_import_module(self.hass, f"{__package__}.analysis")
+        self.tracker_analyzer = analysis.TrackerAnalyzer(
+            [str(tracker.id) for tracker in data_trackers]
+        )
+
     async def update_data_plant(self):
         """Update the internal data from Lumioo."""
         _LOGGER.debug("Updating data plant %s", self.main_meter_id)
-        try:
-            today = date.today()
-            next_day_dt = today + timedelta(days=1)
-            next_day = date(next_day_dt.year, next_day_dt.month, next_day_dt.day)
-
-            date_after = today.isoformat()
-            date_strictly_before = next_day.isoformat()
-
-            data_plant = await self.api.async_get_plant_status(self.plant_id)
-            data_plant_energy_day = await self.api.async_get_plant_energy_days(
-                self.plant_id, date_after, date_strictly_before
-            )
-        except RuntimeError:
-            _LOGGER.error(
-                "Unable to connect to Lumioo while updating meter %s",
-                self.main_meter_id,
-            )
+        self.request_counts["plant"] = 0
+
+        today = date.today()
+        next_day_dt = today + timedelta(days=1)
+        next_day = date(next_day_dt.year, next_day_dt.month, next_day_dt.day)
+
+        date_after = today.isoformat()
+        date_strictly_before = next_day.isoformat()
+
+        results, stale = await self._async_gather_parts(
+            "plant",
+            {
+                "status": self.async_api_call(
+                    "plant", self.api.async_get_plant_status(self.plant_id)
+                ),
+                "energy_day": self.async_api_call(
+                    "plant",
+                    self.api.async_get_plant_energy_days(
+                        self.plant_id, date_after, date_strictly_before
+                    ),
+                ),
+            },
+        )
+
+        previous = self.data["plant"]
+        if "status" in results:
+            snapshot = PlantSnapshot.from_api(results["status"])
+        elif previous is not None:
+            snapshot = previous
+        else:
             return
 
-        self.data["plant"]["main"] = data_plant
-        if len(data_plant_energy_day) > 0:
-            self.data["plant"]["energy_day"] = data_plant_energy_day[0]
+        if "energy_day" in results:
+            energy_days = results["energy_day"]
+            energy_day = (
+                EnergyDaySnapshot.from_api(energy_days[0])
+                if len(energy_days) > 0
+                else None
+            )
         else:
-            self.data["plant"]["energy_day"] = None
+            energy_day = previous.energy_day if previous is not None else None
+
+        self.data["plant"] = self._publish(
+            previous, replace(snapshot, energy_day=energy_day, stale=stale)
+        )
+
+        # The production so far is only saved with the daily milestones, the
+        # next refreshes provide it again after a restart
+        if (
+            energy_day is not None
+            and energy_day.day is not None
+            and self.forecast_accuracy.record_production(
+                energy_day.day,
+                energy_day.production,
+                dt_util.utcnow(),
+                solar_times(energy_day.day, self.latitude, self.longitude).solar_noon,
+            )
+        ):
+            self._async_save_forecast_accuracy()
 
     async def update_data_solar(self):
         """Update the internal data from Lumioo."""
         _LOGGER.debug("Updating solar data %s", self.plant_id)
-        try:
-            today = date.today().isoformat()
+        self.request_counts["solar"] = 0
 
-            data_solar_times = await self.api.async_get_solar_times(
-                self.plant_id, today
-            )
-            data_production_estimates = await self.api.async_get_production_estimates(
-                self.plant_id
-            )
-        except RuntimeError:
-            _LOGGER.error(
-                "Unable to connect to Lumioo while updating solar %d", self.plant_id
+        previous = self.data["solar"]
+        today = dt_util.now().date()
+        times = solar_times(today, self.latitude, self.longitude)
+
+        requests = {
+            "production_estimates": self.async_api_call(
+                "solar", self.api.async_get_production_estimates(self.plant_id)
+            ),
+        }
+        if self._solar_cross_check and self._solar_cross_checked != today:
+            requests["times"] = self.async_api_call(
+                "solar",
+                self.api.async_get_solar_times(self.plant_id, today.isoformat()),
             )
-            return
 
-        self.data["solar"]["times"] = data_solar_times
-        self.data["solar"]["production_estimates"] = {}
+        results, stale = await self._async_gather_parts("solar", requests)
 
-        for pe in data_production_estimates:
-            data = {}
-            data["production_index"] = pe["production_index"]
-            data["production"] = pe["production"]
+        if "times" in results:
+            self._solar_cross_checked = today
+            self._cross_check_solar_times(times, results["times"])
 
-            ref = pe["reference"]
+        if "production_estimates" in results:
+            production_estimates = SolarSnapshot.estimates_from_api(
+                results["production_estimates"]
+            )
+            self._record_forecasts(today, production_estimates)
+        else:
+            production_estimates = previous.production_estimates if previous else {}
+
+        self.data["solar"] = self._publish(
+            previous,
+            SolarSnapshot(
+                sunrise=times.sunrise,
+                sunset=times.sunset,
+                solar_noon=times.solar_noon,
+                production_estimates=production_estimates,
+                forecast_mape=self.forecast_accuracy.mape,
+                forecast_bias=self.forecast_accuracy.bias,
+                # The sun events are computed locally, the API only checks them
+                stale=stale - {"times"},
+            ),
+        )
+        self.data["sun"] = self._publish(
+            self.data["sun"],
+            SunSnapshot(
+                elevation=round(
+                    solar_elevation(dt_util.utcnow(), self.latitude, self.longitude),
+                    1,
+                ),
+            ),
+        )
+
+    def _record_forecasts(
+        self, today: date, production_estimates: dict[str, ProductionEstimate]
+    ):
+        """Keep the forecast windows to compare them with the actual production."""
+        tomorrow = today + timedelta(days=1)
+        changed = False
+        for window in (WINDOW_MORNING, WINDOW_AFTERNOON):
+            for day, prefix in ((today, "today"), (tomorrow, "tomorrow")):
+                if (estimate := production_estimates.get(f"{prefix}_{window}")) is None:
+                    continue
+                changed |= self.forecast_accuracy.record_forecast(
+                    day, window, estimate.production, day_ahead=day == tomorrow
+                )
+        if changed:
+            self._async_save_forecast_accuracy()
+
+    @callback
+    def _async_save_forecast_accuracy(self):
+        """Schedule saving the forecast accuracy state."""
+        if self._forecast_accuracy_store is not None:
+            self._forecast_accuracy_store.async_delay_save(
+                self.forecast_accuracy.as_dict, FORECAST_ACCURACY_SAVE_DELAY
+            )
 
-            self.data["solar"]["production_estimates"][ref] = data
+    def _cross_check_solar_times(self, times: SolarTimes, data_solar_times):
+        """Compare the computed sun events with the ones reported by Lumioo."""
+        for event in ("sunrise", "sunset"):
+            computed: datetime | None = getattr(times, event)
+            reported = as_datetime(data_solar_times.get(event))
+            if computed is None or reported is None:
+                continue
+            if abs((computed - reported).total_seconds()) > SOLAR_TIMES_TOLERANCE:
+                _LOGGER.warning(
+                    "Computed %s %s differs from the one reported by Lumioo %s "
+                    "for plant %s, check the plant coordinates",
+                    event,
+                    computed,
+                    reported,
+                    self.plant_id,
+                )
 
     async def update_data_trackers(self):
         """Update the internal data from Lumioo."""
         _LOGGER.debug("Updating trackers data %s", self.main_meter_id)
-        try:
-            for tracker in self.trackers:
-                self.data["trackers"][
-                    str(tracker.id)
-                ] = await self.api.async_get_tracker_status(tracker.id)
-        except RuntimeError:
-            _LOGGER.error(
-                "Unable to connect to Lumioo while updating meter %s",
-                self.main_meter_id,
-            )
-            return
+        self.request_counts["trackers"] = 0
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        started: set[int] = set()
+
+        async def _async_get_tracker_status(tracker_id):
+            async with semaphore:
+                started.add(tracker_id)
+                return await self.async_api_call(
+                    "trackers", self.api.async_get_tracker_status(tracker_id)
+                )
+
+        # Requests are queued in order and the deadline cuts the end of the
+        # queue, so each cycle starts with the trackers the previous one did
+        # not reach. On large plants every tracker is refreshed in turn.
+        count = len(self.trackers)
+        order = [
+            self.trackers[(self._tracker_offset + index) % count]
+            for index in range(count)
+        ]
+        results, stale = await self._async_gather_parts(
+            "trackers",
+            {
+                str(tracker.id): _async_get_tracker_status(tracker.id)
+                for tracker in order
+            },
+        )
+        not_reached = (
+            index for index, tracker in enumerate(order) if tracker.id not in started
+        )
+        if (index := next(not_reached, None)) is not None:
+            self._tracker_offset = (self._tracker_offset + index) % count
+
+        previous = self.data["trackers"]
+        trackers = {}
+        for tracker_id, data in results.items():
+            previous_snapshot = previous.get(tracker_id)
+            snapshot = self._publish(previous_snapshot, TrackerSnapshot.from_api(data))
+            trackers[tracker_id] = snapshot
+            # Only new readings are cached, so the cache is bounded in readings
+            if snapshot.production_time is not None and (
+                previous_snapshot is None
+                or snapshot.production_time != previous_snapshot.production_time
+            ):
+                self.tracker_samples.append((tracker_id, snapshot))
+        for tracker_id in stale:
+            if (snapshot := previous.get(tracker_id)) is not None:
+                trackers[tracker_id] = self._publish(
+                    snapshot, replace(snapshot, stale=frozenset({"status"}))
+                )
+        self.data["trackers"] = trackers
+
+        self.analyse_trackers()
+
+    def analyse_trackers(self):
+        """Compare the latest production and wind readings of all trackers."""
+        production = []
+        wind_speed = []
+        for tracker_id in self.tracker_analyzer.tracker_ids:
+            snapshot = self.data["trackers"].get(tracker_id)
+            if snapshot is None or snapshot.stale:
+                production.append(None)
+                wind_speed.append(None)
+                continue
+            production.append(snapshot.production)
+            wind_speed.append(snapshot.average_wind_speed)
+
+        self.tracker_analysis = self.tracker_analyzer.update(production, wind_speed)
 
     async def update_data_meter(self):
         """Update the internal data from Lumioo."""
         _LOGGER.debug("Updating meter data %s", self.main_meter_id)
-        try:
-            data = await self.api.async_get_meter_status(self.main_meter_id)
-        except RuntimeError:
-            _LOGGER.error(
-                "Unable to connect to Lumioo while updating meter %s",
-                self.main_meter_id,
-            )
+        self.request_counts["meter"] = 0
+
+        results, stale = await self._async_gather_parts(
+            "meter",
+            {
+                "status": self.async_api_call(
+                    "meter", self.api.async_get_meter_status(self.main_meter_id)
+                ),
+            },
+        )
+
+        previous = self.data["meter"]
+        if "status" in results:
+            snapshot = MeterSnapshot.from_api(results["status"])
+        elif previous is not None:
+            snapshot = previous
+        else:
             return
 
-        self.data["meter"] = data
+        self.data["meter"] = self._publish(previous, replace(snapshot, stale=stale))
+
+
+def _async_create_clientsession() -> aiohttp.ClientSession:
+    """Create the HTTP connection pool dedicated to Lumioo requests.
+
+    Connections are kept alive between refreshes so each poll reuses warm
+    TLS connections, and the per host limit matches the concurrency used to
+    fan out tracker requests.
+    """
+    connector = aiohttp.TCPConnector(
+        limit_per_host=MAX_CONCURRENT_REQUESTS,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+        use_dns_cache=True,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+        # Reuse the shared SSL context instead of building one in the event loop
+        ssl=get_default_context(),
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        # Requests are bounded by ENDPOINT_TIMEOUT, see LumiooConnector
+        timeout=aiohttp.ClientTimeout(sock_connect=HTTP_CONNECT_TIMEOUT),
+        headers={
+            ACCEPT_ENCODING: "gzip, deflate",
+            USER_AGENT: aiohttp_client.SERVER_SOFTWARE,
+        },
+        auto_decompress=True,
+    )
@@ -0,0 +1,146 @@
+"""Accuracy tracking of the Lumioo production forecast."""
+from __future__ import annotations
+
+from collections import deque
+from datetime import date, datetime
+from typing import Any
+
+from .const import FORECAST_ACCURACY_HORIZON
+
+WINDOW_MORNING = "morning"
+WINDOW_AFTERNOON = "afternoon"
+
+
+class ForecastAccuracy:
+    """Compare forecast windows with the actual production of a plant.
+
+    The forecast of a window is the latest day-ahead forecast, or the first
+    same-day one when no day-ahead forecast was seen. The actual production
+    of the morning is the plant production at solar noon, the afternoon gets
+    the rest of the day. Errors are kept over a rolling horizon and the
+    statistics are maintained incrementally as windows enter and leave it.
+    """
+
+    def __init__(self, horizon: int = FORECAST_ACCURACY_HORIZON) -> None:
+        """Initialize the accuracy tracker, horizon being a number of days."""
+        # (day, window, forecast, actual) of the evaluated windows
+        self._samples: deque[tuple[str, str, float, float]] = deque(
+            maxlen=horizon * 2
+        )
+        self._abs_pct_error_sum = 0.0
+        self._error_sum = 0.0
+
+        self._forecasts: dict[str, dict[str, float]] = {}
+        self._day: date | None = None
+        self._production: float | None = None
+        self._morning_production: float | None = None
+
+    @property
+    def mape(self) -> float | None:
+        """Return the mean absolute percentage error, in percent."""
+        if not self._samples:
+            return None
+        return round(self._abs_pct_error_sum / len(self._samples) * 100, 1)
+
+    @property
+    def bias(self) -> float | None:
+        """Return the mean forecast error, positive when overestimating."""
+        if not self._samples:
+            return None
+        return round(self._error_sum / len(self._samples))
+
+    def record_forecast(
+        self, day: date, window: str, production: float | None, day_ahead: bool
+    ) -> bool:
+        """Record the forecast production of a window of a day.
+
+        Return True when the kept forecast changed.
+        """
+        if production is None:
+            return False
+        forecasts = self._forecasts.setdefault(day.isoformat(), {})
+        if window in forecasts and not day_ahead:
+            return False
+        if forecasts.get(window) == production:
+            return False
+        forecasts[window] = production
+        return True
+
+    def record_production(
+        self, day: date, production: float | None, now: datetime, solar_noon: datetime
+    ) -> bool:
+        """Record the production of the plant so far on a day.
+
+        Return True when a day was completed and evaluated, or when the
+        morning production was recorded.
+        """
+        if production is None:
+            return False
+
+        changed = False
+        if self._day is not None and day > self._day:
+            changed = self._evaluate_day()
+        if self._day is None or day > self._day:
+            self._day = day
+            self._morning_production = None
+
+        if day == self._day:
+            self._production = production
+            if self._morning_production is None and now >= solar_noon:
+                self._morning_production = production
+                changed = True
+        return changed
+
+    def _evaluate_day(self) -> bool:
+        """Evaluate the forecast windows of the tracked day."""
+        day = self._day.isoformat()
+        forecasts = self._forecasts.pop(day, {})
+        # Forget forecasts of days that will never be evaluated
+        for other_day in [d for d in self._forecasts if d < day]:
+            del self._forecasts[other_day]
+
+        if self._production is None or self._morning_production is None:
+            return False
+
+        actuals = {
+            WINDOW_MORNING: self._morning_production,
+            WINDOW_AFTERNOON: self._production - self._morning_production,
+        }
+        evaluated = False
+        for window, actual in actuals.items():
+            if window in forecasts and actual > 0:
+                self._add_sample((day, window, forecasts[window], actual))
+                evaluated = True
+        return evaluated
+
+    def _add_sample(self, sample: tuple[str, str, float, float]) -> None:
+        """Add an evaluated window, evicting the oldest one past the horizon."""
+        if len(self._samples) == self._samples.maxlen:
+            self._update_sums(self._samples[0], -1)
+        self._samples.append(sample)
+        self._update_sums(sample, 1)
+
+    def _update_sums(self, sample: tuple[str, str, float, float], sign: int) -> None:
+        """Add or remove a sample from the running sums."""
+        _, _, forecast, actual = sample
+        self._abs_pct_error_sum += sign * abs(forecast - actual) / actual
+        self._error_sum += sign * (forecast - actual)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state to store."""
+        return {
+            "samples": list(self._samples),
+            "forecasts": self._forecasts,
+            "day": self._day.isoformat() if self._day else None,
+            "production": self._production,
+            "morning_production": self._morning_production,
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore a stored state."""
+        for sample in data.get("samples", []):
+            self._add_sample(tuple(sample))
+        self._forecasts = data.get("forecasts", {})
+        self._day = date.fromisoformat(data["day"]) if data.get("day") else None
+        self._production = data.get("production")
+        self._morning_production = data.get("morning_production")
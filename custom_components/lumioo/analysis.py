@@ -0,0 +1,97 @@
+"""Cross tracker production analysis for Lumioo."""
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+import warnings
+
+import numpy as np
+
+from .const import (
+    UNDERPERFORMANCE_WINDOW,
+    UNDERPERFORMANCE_MIN_PRODUCTION,
+    UNDERPERFORMANCE_MIN_DEVIATION,
+    UNDERPERFORMANCE_ZSCORE,
+)
+
+# Scale factor turning a median absolute deviation into a standard deviation
+MAD_SCALE = 1.4826
+
+
+@dataclass(frozen=True)
+class TrackerAnalysis:
+    """Result of a cross tracker analysis cycle, keyed by tracker id."""
+
+    deviation: dict[str, float | None]
+    zscore: dict[str, float | None]
+    wind_deviation: dict[str, float | None]
+    underperforming: frozenset[str]
+
+
+class TrackerAnalyzer:
+    """Compare the production of all the trackers of a plant.
+
+    Each cycle computes, for all trackers at once, the deviation of the
+    production from the plant median. Deviations are kept over a rolling
+    window and a robust z-score of the rolling deviation flags the trackers
+    that consistently produce less than their neighbours.
+    """
+
+    def __init__(
+        self, tracker_ids: Sequence[str], window: int = UNDERPERFORMANCE_WINDOW
+    ) -> None:
+        """Initialize the analyzer."""
+        self.tracker_ids = list(tracker_ids)
+        self._history = np.full((window, len(self.tracker_ids)), np.nan)
+        self._cycle = 0
+
+    def update(
+        self,
+        production: Sequence[float | None],
+        wind_speed: Sequence[float | None],
+    ) -> TrackerAnalysis:
+        """Add the readings of a cycle, ordered as tracker_ids, and analyse them."""
+        production_arr = np.array(production, dtype=float)
+        wind_arr = np.array(wind_speed, dtype=float)
+
+        with warnings.catch_warnings():
+            # Nights and missing readings produce all-NaN slices
+            warnings.simplefilter("ignore", RuntimeWarning)
+
+            median = np.nanmedian(production_arr)
+            if np.isfinite(median) and median >= UNDERPERFORMANCE_MIN_PRODUCTION:
+                deviation = (production_arr - median) / median
+            else:
+                deviation = np.full(len(self.tracker_ids), np.nan)
+
+            self._history[self._cycle % len(self._history)] = deviation
+            self._cycle += 1
+
+            rolling = np.nanmean(self._history, axis=0)
+            center = np.nanmedian(rolling)
+            spread = np.nanmedian(np.abs(rolling - center)) * MAD_SCALE
+            zscore = (rolling - center) / max(spread, np.finfo(float).eps)
+
+            wind_deviation = wind_arr - np.nanmedian(wind_arr)
+
+        underperforming = (zscore < -UNDERPERFORMANCE_ZSCORE) & (
+            rolling < -UNDERPERFORMANCE_MIN_DEVIATION
+        )
+
+        return TrackerAnalysis(
+            deviation=self._to_dict(deviation),
+            zscore=self._to_dict(zscore),
+            wind_deviation=self._to_dict(wind_deviation),
+            underperforming=frozenset(
+                tracker_id
+                for tracker_id, flagged in zip(self.tracker_ids, underperforming)
+                if flagged
+            ),
+        )
+
+    def _to_dict(self, values: np.ndarray) -> dict[str, float | None]:
+        """Map an array ordered as tracker_ids to a dict, NaN becoming None."""
+        return {
+            tracker_id: round(value, 3) if np.isfinite(value) else None
+            for tracker_id, value in zip(self.tracker_ids, values.tolist())
+        }
@@ -0,0 +1,98 @@
+"""Support for Lumioo binary sensor."""
+from __future__ import annotations
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+)
+
+from .const import DOMAIN, DATA, COORDINATOR_TRACKERS
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Setup binary sensors from a config entry created in the integrations UI."""
+    data = hass.data[DOMAIN][config_entry.entry_id]
+    lumioo = data[DATA]
+
+    coordinator_trackers: DataUpdateCoordinator = data[COORDINATOR_TRACKERS]
+
+    async_add_entities(
+        LumiooTrackerUnderperformingSensor(
+            lumioo,
+            str(tracker.id),
+            tracker.id,
+            coordinator_trackers,
+        )
+        for tracker in lumioo.trackers
+    )
+
+
+class LumiooTrackerUnderperformingSensor(CoordinatorEntity, BinarySensorEntity):
+    """Flag a tracker producing consistently less than the rest of the plant.
+
+    The state is only written when the flag or the availability changes, the
+    deviations computed on each cycle are available in the diagnostics.
+    """
+
+    _attr_has_entity_name = True
+    _attr_name = "Underperforming"
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        lumioo,
+        tracker_id: str,
+        device_id,
+        coordinator: DataUpdateCoordinator,
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator)
+
+        self.lumioo = lumioo
+        self.tracker_id = tracker_id
+        self._available = coordinator.last_update_success
+
+        self._attr_unique_id = f"lumioo {device_id} trackers underperforming"
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, device_id)})
+        self._update_from_analysis()
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        return self._available
+
+    def _update_from_analysis(self) -> bool:
+        """Update the state from the latest cross tracker analysis.
+
+        Return True if the state changed.
+        """
+        analysis = self.lumioo.tracker_analysis
+        is_on = None
+        if analysis is not None:
+            is_on = self.tracker_id in analysis.underperforming
+        if is_on == self._attr_is_on:
+            return False
+        self._attr_is_on = is_on
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Call when the coordinator has an update."""
+        available = self.coordinator.last_update_success
+        if self._update_from_analysis() or available != self._available:
+            self._available = available
+            self.async_write_ha_state()
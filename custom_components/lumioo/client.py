@@ -0,0 +1,15 @@
+"""Lumioo API client.
+
+Imported lazily, in the executor, so loading the integration does not pull
+the lumioo library.
+"""
+from __future__ import annotations
+
+import aiohttp
+from lumioo.auth import Auth
+from lumioo.core import LumiooHubAPI
+
+
+def create_api(session: aiohttp.ClientSession, access_token: str) -> LumiooHubAPI:
+    """Return a Lumioo API client using the given HTTP session."""
+    return LumiooHubAPI(Auth(session, access_token))
@@ -1,6 +1,7 @@
 """Config flow for Lumioo integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -10,34 +11,55 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
-
-from .const import DOMAIN
-
-import aiohttp
-from lumioo.auth import Auth
-from lumioo.core import LumiooHubAPI
+from homeassistant.helpers import aiohttp_client
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.importlib import async_import_module
+
+from .const import (
+    DOMAIN,
+    CONF_PLANT_ID,
+    CONF_PLANTS,
+    CONF_REFRESH_COOLDOWN,
+    CONF_SOLAR_CROSS_CHECK,
+    DEBOUNCE_COOLDOWN,
+    MAX_CONCURRENT_REQUESTS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 STEP_USER_DATA_SCHEMA = vol.Schema({vol.Required("access_token"): str})
 
+# Source of the flows adding the other plants selected in a user flow
+SOURCE_ADD_PLANT = "add_plant"
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect.
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
+    The details of all the plants of the account are fetched concurrently.
     """
 
-    async with aiohttp.ClientSession() as session:
-        try:
-            auth = Auth(session, data["access_token"])
-            api = LumiooHubAPI(auth)
+    client = await async_import_module(hass, f"{__package__}.client")
+    session = aiohttp_client.async_get_clientsession(hass)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def _async_get_plant_details(plant_id):
+        async with semaphore:
+            return await asyncio.gather(
+                api.async_get_plant(plant_id), api.async_get_trackers(plant_id)
+            )
 
-            plants = await api.async_get_plants()
+    try:
+        api = client.create_api(session, data["access_token"])
 
-            plant = await api.async_get_plant(plants[0].id)
-        except Exception as exc:
-            raise CannotConnect from exc
+        plants = await api.async_get_plants()
+
+        details = await asyncio.gather(
+            *(_async_get_plant_details(plant.id) for plant in plants)
+        )
+    except Exception as exc:
+        raise CannotConnect from exc
 
     # If you cannot connect:
     # throw CannotConnect
@@ -45,7 +67,15 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     # InvalidAuth
 
     # Return info that you want to store in the config entry.
-    return {"title": plant.alias_installation}
+    return {
+        "plants": {
+            str(plant.id): {
+                "title": plant_details.alias_installation,
+                "trackers": len(trackers),
+            }
+            for plant, (plant_details, trackers) in zip(plants, details)
+        }
+    }
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -53,6 +83,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._access_token: str | None = None
+        self._plants: dict[str, dict[str, Any]] = {}
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -70,12 +105,113 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             else:
-                return self.async_create_entry(title=info["title"], data=user_input)
+                configured = self._async_current_ids()
+                self._access_token = user_input["access_token"]
+                updated = False
+                self._plants = {}
+                for plant_id, plant in info["plants"].items():
+                    if (entry := self._async_plant_entry(plant_id)) is not None:
+                        updated |= self._async_update_access_token(entry)
+                    elif plant_id not in configured:
+                        self._plants[plant_id] = plant
+                if not self._plants:
+                    return self.async_abort(
+                        reason="token_updated" if updated else "no_plants"
+                    )
+                if len(self._plants) == 1:
+                    plant_id = next(iter(self._plants))
+                    return await self._async_create_plant_entry(plant_id)
+                return await self.async_step_plants()
 
         return self.async_show_form(
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
 
+    async def async_step_plants(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Select the plants to add, each one getting its own entry."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            if selected := user_input[CONF_PLANTS]:
+                for plant_id in selected[1:]:
+                    self.hass.async_create_task(
+                        self.hass.config_entries.flow.async_init(
+                            DOMAIN,
+                            context={"source": SOURCE_ADD_PLANT},
+                            data={
+                                "access_token": self._access_token,
+                                CONF_PLANT_ID: int(plant_id),
+                                "title": self._plants[plant_id]["title"],
+                            },
+                        )
+                    )
+                return await self._async_create_plant_entry(selected[0])
+            errors["base"] = "no_plant_selected"
+
+        plants = {
+            plant_id: f"{plant['title']} ({plant['trackers']} trackers)"
+            for plant_id, plant in self._plants.items()
+        }
+        return self.async_show_form(
+            step_id="plants",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_PLANTS, default=list(plants)
+                    ): cv.multi_select(plants)
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_add_plant(self, plant_data: dict[str, Any]) -> FlowResult:
+        """Add a plant selected in another flow."""
+        await self.async_set_unique_id(str(plant_data[CONF_PLANT_ID]))
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(
+            title=plant_data["title"],
+            data={
+                "access_token": plant_data["access_token"],
+                CONF_PLANT_ID: plant_data[CONF_PLANT_ID],
+            },
+        )
+
+    @callback
+    def _async_plant_entry(self, plant_id: str) -> config_entries.ConfigEntry | None:
+        """Return the entry already monitoring a plant, ignored ones excluded."""
+        for entry in self._async_current_entries(include_ignore=False):
+            if entry.unique_id == plant_id:
+                return entry
+        return None
+
+    @callback
+    def _async_update_access_token(self, entry: config_entries.ConfigEntry) -> bool:
+        """Give the new access token to an entry, return True if it changed.
+
+        Adding a plant again, for example after a token rotation, updates the
+        entry monitoring it instead of creating a duplicate of it.
+        """
+        if entry.data["access_token"] == self._access_token:
+            return False
+        self.hass.config_entries.async_update_entry(
+            entry, data={**entry.data, "access_token": self._access_token}
+        )
+        self.hass.async_create_task(
+            self.hass.config_entries.async_reload(entry.entry_id)
+        )
+        return True
+
+    async def _async_create_plant_entry(self, plant_id: str) -> FlowResult:
+        """Create the entry of a plant."""
+        await self.async_set_unique_id(plant_id)
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(
+            title=self._plants[plant_id]["title"],
+            data={"access_token": self._access_token, CONF_PLANT_ID: int(plant_id)},
+        )
+
     @staticmethod
     @callback
     def async_get_options_flow(
@@ -91,7 +227,6 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
         self.config_entry = config_entry
-        print(config_entry.data.get("access_token"))
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -101,7 +236,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
         if user_input is not None:
             try:
-                info = await validate_input(self.hass, user_input)
+                await validate_input(self.hass, user_input)
             except CannotConnect:
                 errors["base"] = "cannot_connect"
             except InvalidAuth:
@@ -110,7 +245,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             else:
-                return self.async_create_entry(title=info["title"], data=user_input)
+                return self.async_create_entry(title="", data=user_input)
 
         return self.async_show_form(
             step_id="init",
@@ -119,7 +254,19 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     vol.Required(
                         "access_token",
                         default=self.config_entry.data.get("access_token"),
-                    ): str
+                    ): str,
+                    vol.Optional(
+                        CONF_SOLAR_CROSS_CHECK,
+                        default=self.config_entry.options.get(
+                            CONF_SOLAR_CROSS_CHECK, True
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_REFRESH_COOLDOWN,
+                        default=self.config_entry.options.get(
+                            CONF_REFRESH_COOLDOWN, DEBOUNCE_COOLDOWN
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
                 }
             ),
         )
@@ -12,8 +12,22 @@ COORDINATOR_METER = "coordinator_meter"
 UPDATE_LISTENER = "update_listener"
 
 SIGNAL_LUMIOO_UPDATE_RECEIVED = "lumioo_update_received_{}_{}_{}"
+# Device identifier of the solar forecast of a plant
+SOLAR_DEVICE_IDENTIFIER = "{}_solar"
 
-DEBOUNCE_COOLDOWN = 1800  # Seconds
+CONF_PLANT_ID = "plant_id"
+CONF_PLANTS = "plants"
+CONF_REFRESH_COOLDOWN = "refresh_cooldown"
+CONF_SOLAR_CROSS_CHECK = "solar_cross_check"
+
+DEBOUNCE_COOLDOWN = 10  # Seconds
+
+MAX_CONCURRENT_REQUESTS = 4
+HTTP_KEEPALIVE_TIMEOUT = 120  # Seconds
+HTTP_DNS_CACHE_TTL = 300  # Seconds
+HTTP_CONNECT_TIMEOUT = 10  # Seconds
+ENDPOINT_TIMEOUT = 15  # Seconds
+REFRESH_DEADLINE = 45  # Seconds
 
 DEVICE_TYPES = {
     "plant": "Plant",
@@ -21,3 +35,24 @@ DEVICE_TYPES = {
     "trackers": "Tracker",
     "meter": "Meter",
 }
+
+UNDERPERFORMANCE_WINDOW = 15  # Refresh cycles
+UNDERPERFORMANCE_MIN_PRODUCTION = 50  # Watts, plant median below is ignored
+UNDERPERFORMANCE_MIN_DEVIATION = 0.2  # Fraction of the plant median
+UNDERPERFORMANCE_ZSCORE = 3.0
+
+SOLAR_TIMES_TOLERANCE = 600  # Seconds
+
+FORECAST_ACCURACY_HORIZON = 30  # Days
+FORECAST_ACCURACY_SAVE_DELAY = 30  # Seconds, shorter than the refresh interval
+FORECAST_ACCURACY_STORAGE_VERSION = 1
+
+TRACKER_SAMPLES_CACHE_SIZE = 50000  # Tracker readings
+
+DATASET_ENERGY_DAYS = "plant_energy_days"
+DATASET_TRACKER_SAMPLES = "tracker_samples"
+FORMAT_CSV = "csv"
+FORMAT_PARQUET = "parquet"
+EXPORT_DIRECTORY = "lumioo_exports"  # In the configuration directory
+EXPORT_PAGE_DAYS = 31
+EXPORT_CHUNK_SIZE = 1000  # Rows
@@ -0,0 +1,79 @@
+"""Diagnostics support for Lumioo."""
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_ACCESS_TOKEN
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, DATA
+
+TO_REDACT = {
+    CONF_ACCESS_TOKEN,
+    "address",
+    "email",
+    "latitude",
+    "longitude",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    The latest data snapshots are dumped with credentials and location
+    redacted, together with the number of requests issued by the latest
+    refresh of each subsystem and the latest cross tracker analysis.
+    """
+    lumioo = hass.data[DOMAIN][entry.entry_id][DATA]
+    data = {
+        "plant": _snapshot(lumioo.data["plant"]),
+        "solar": _snapshot(lumioo.data["solar"]),
+        "sun": _snapshot(lumioo.data["sun"]),
+        "trackers": {
+            tracker_id: _snapshot(snapshot)
+            for tracker_id, snapshot in lumioo.data["trackers"].items()
+        },
+        "meter": _snapshot(lumioo.data["meter"]),
+    }
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "plant_id": lumioo.plant_id,
+        "main_meter_id": lumioo.main_meter_id,
+        "trackers": [tracker.id for tracker in lumioo.trackers or []],
+        "requests": {
+            "last_cycle": dict(lumioo.request_counts),
+            "total": lumioo.request_total,
+        },
+        "data": async_redact_data(data, TO_REDACT),
+        "tracker_analysis": _tracker_analysis(lumioo.tracker_analysis),
+    }
+
+
+def _snapshot(snapshot) -> dict[str, Any] | None:
+    """Return a snapshot as JSON serializable data."""
+    if snapshot is None:
+        return None
+    data = asdict(snapshot)
+    data["stale"] = sorted(snapshot.stale)
+    return data
+
+
+def _tracker_analysis(analysis) -> dict[str, Any] | None:
+    """Return the figures of the latest cross tracker analysis, per tracker."""
+    if analysis is None:
+        return None
+    return {
+        tracker_id: {
+            "production_deviation": deviation,
+            "production_zscore": analysis.zscore.get(tracker_id),
+            "wind_speed_deviation": analysis.wind_deviation.get(tracker_id),
+            "underperforming": tracker_id in analysis.underperforming,
+        }
+        for tracker_id, deviation in analysis.deviation.items()
+    }
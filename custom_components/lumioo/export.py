@@ -0,0 +1,207 @@
+"""Streaming export of Lumioo history to files."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+from contextlib import suppress
+import csv
+from dataclasses import asdict
+import os
+from datetime import date, timedelta
+from typing import Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import EXPORT_CHUNK_SIZE, EXPORT_PAGE_DAYS, FORMAT_CSV, FORMAT_PARQUET
+from .models import EnergyDaySnapshot, TrackerSnapshot
+
+# Exported columns and their type
+ENERGY_DAY_FIELDS = {
+    "day": "date",
+    "production": "float",
+    "consumption": "float",
+    "auto_consumption": "float",
+    "grid_consumption": "float",
+    "grid_restitution": "float",
+}
+TRACKER_SAMPLE_FIELDS = {
+    "tracker_id": "string",
+    "production_time": "timestamp",
+    "production": "float",
+    "average_wind_speed": "float",
+    "max_wind_speed": "float",
+    "wind_speed_time": "timestamp",
+    "status_reference": "string",
+}
+
+
+async def async_iter_energy_days(
+    lumioo, start: date, end: date
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield the energy days of the plant between start and end included.
+
+    The range is requested page by page so a multi-year range never has to
+    be held in memory. Requests go through the connector, with its timeout,
+    and are accounted to the export.
+    """
+    lumioo.request_counts["export"] = 0
+    page_start = start
+    while page_start <= end:
+        page_end = min(
+            page_start + timedelta(days=EXPORT_PAGE_DAYS), end + timedelta(days=1)
+        )
+        try:
+            energy_days = await lumioo.async_api_call(
+                "export",
+                lumioo.api.async_get_plant_energy_days(
+                    lumioo.plant_id, page_start.isoformat(), page_end.isoformat()
+                ),
+            )
+        except (RuntimeError, asyncio.TimeoutError, aiohttp.ClientError) as exc:
+            raise HomeAssistantError(
+                f"Unable to fetch the energy days from {page_start} from Lumioo: "
+                f"{exc!r}"
+            ) from exc
+        for energy_day in energy_days:
+            yield asdict(EnergyDaySnapshot.from_api(energy_day))
+        page_start = page_end
+
+
+async def async_iter_tracker_samples(
+    lumioo, start: date, end: date
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield the cached tracker samples between start and end included."""
+    for tracker_id, snapshot in list(lumioo.tracker_samples):
+        if start <= snapshot.production_time.date() <= end:
+            yield _tracker_sample(tracker_id, snapshot)
+
+
+def _tracker_sample(tracker_id: str, snapshot: TrackerSnapshot) -> dict[str, Any]:
+    """Return the exported row of a tracker snapshot."""
+    return {
+        "tracker_id": tracker_id,
+        "production_time": snapshot.production_time,
+        "production": snapshot.production,
+        "average_wind_speed": snapshot.average_wind_speed,
+        "max_wind_speed": snapshot.max_wind_speed,
+        "wind_speed_time": snapshot.wind_speed_time,
+        "status_reference": snapshot.status_reference,
+    }
+
+
+class _CsvWriter:
+    """Write rows to a CSV file."""
+
+    def __init__(self, path: str, fields: dict[str, str]) -> None:
+        """Create the file and write the header."""
+        self._file = open(path, "x", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=list(fields))
+        self._writer.writeheader()
+
+    def write(self, rows: Iterable[dict[str, Any]]) -> None:
+        """Write a chunk of rows."""
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        """Close the file."""
+        self._file.close()
+
+
+class _ParquetWriter:
+    """Write rows to a Parquet file, one row group per chunk."""
+
+    def __init__(self, path: str, fields: dict[str, str]) -> None:
+        """Create the file."""
+        try:
+            # pylint: disable-next=import-outside-toplevel
+            import pyarrow as pa
+
+            # pylint: disable-next=import-outside-toplevel
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise HomeAssistantError(
+                "Exporting to Parquet requires the pyarrow package"
+            ) from exc
+
+        types = {
+            "date": pa.date32(),
+            "float": pa.float64(),
+            "string": pa.string(),
+            "timestamp": pa.timestamp("us", tz="UTC"),
+        }
+        self._pa = pa
+        self._schema = pa.schema(
+            [(name, types[field_type]) for name, field_type in fields.items()]
+        )
+        self._file = open(path, "xb")
+        self._writer = pq.ParquetWriter(self._file, self._schema)
+
+    def write(self, rows: Iterable[dict[str, Any]]) -> None:
+        """Write a chunk of rows."""
+        self._writer.write_table(
+            self._pa.Table.from_pylist(list(rows), schema=self._schema)
+        )
+
+    def close(self) -> None:
+        """Close the file."""
+        self._writer.close()
+        self._file.close()
+
+
+def _create_writer(writer_cls, path: str, fields: dict[str, str]):
+    """Create the export directory if needed and open a new file in it."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return writer_cls(path, fields)
+
+
+async def async_export(
+    hass: HomeAssistant,
+    rows: AsyncIterator[dict[str, Any]],
+    fields: dict[str, str],
+    path: str,
+    file_format: str,
+) -> int:
+    """Write the rows to a new file chunk by chunk and return the number of rows.
+
+    Existing files are never overwritten, and the file is removed if the
+    export fails so it can be run again.
+    """
+    writer_cls = {FORMAT_CSV: _CsvWriter, FORMAT_PARQUET: _ParquetWriter}[file_format]
+    try:
+        writer = await hass.async_add_executor_job(
+            _create_writer, writer_cls, path, fields
+        )
+    except FileExistsError as exc:
+        raise HomeAssistantError(f"{path} already exists") from exc
+
+    count = 0
+    chunk: list[dict[str, Any]] = []
+    completed = False
+    try:
+        async for row in rows:
+            chunk.append(row)
+            if len(chunk) >= EXPORT_CHUNK_SIZE:
+                await hass.async_add_executor_job(writer.write, chunk)
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            await hass.async_add_executor_job(writer.write, chunk)
+            count += len(chunk)
+        completed = True
+    finally:
+        await hass.async_add_executor_job(_close_writer, writer, path, completed)
+
+    return count
+
+
+def _close_writer(writer, path: str, completed: bool) -> None:
+    """Close the file, removing it if the export did not complete."""
+    try:
+        writer.close()
+    finally:
+        if not completed:
+            with suppress(FileNotFoundError):
+                os.remove(path)
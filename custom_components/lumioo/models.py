@@ -0,0 +1,167 @@
+"""Snapshots of the data fetched from Lumioo.
+
+Snapshots are immutable: every refresh builds new objects and publishes them
+at once, so entities never read a partially updated state. Each published
+snapshot carries a version that only changes when its content changes, and
+the parts of it that could not be refreshed in time are listed as stale.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any
+
+from .util import as_date, as_datetime
+
+
+@dataclass(frozen=True, slots=True)
+class EnergyDaySnapshot:
+    """Energy totals of a plant for a day."""
+
+    day: date | None
+    production: float | None
+    consumption: float | None
+    auto_consumption: float | None
+    grid_consumption: float | None
+    grid_restitution: float | None
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> EnergyDaySnapshot:
+        """Build the snapshot from an energy day payload."""
+        return cls(
+            day=as_date(data.get("date")),
+            production=data.get("production"),
+            consumption=data.get("consumption"),
+            auto_consumption=data.get("auto_consumption"),
+            grid_consumption=data.get("grid_consumption"),
+            grid_restitution=data.get("grid_restitution"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PlantSnapshot:
+    """Status of a plant."""
+
+    id: int
+    is_synchronised: bool | None
+    latest_synchronisation: datetime | None
+    status_reference: str | None
+    energy_day: EnergyDaySnapshot | None = None
+    stale: frozenset[str] = frozenset()
+    version: int = field(default=0, compare=False)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> PlantSnapshot:
+        """Build the snapshot from a plant status payload."""
+        return cls(
+            id=data["id"],
+            is_synchronised=data.get("is_synchronised"),
+            latest_synchronisation=as_datetime(data.get("latest_synchronisation")),
+            status_reference=(data.get("status_type") or {}).get("reference"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ProductionEstimate:
+    """Production forecast of a time window."""
+
+    production: float | None
+    production_index: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class SolarSnapshot:
+    """Sun events and production forecast of a plant."""
+
+    sunrise: datetime | None
+    sunset: datetime | None
+    solar_noon: datetime | None
+    # Keyed by forecast window reference, such as today_morning
+    production_estimates: dict[str, ProductionEstimate]
+    forecast_mape: float | None = None
+    forecast_bias: float | None = None
+    stale: frozenset[str] = frozenset()
+    version: int = field(default=0, compare=False)
+
+    @staticmethod
+    def estimates_from_api(
+        data: list[dict[str, Any]],
+    ) -> dict[str, ProductionEstimate]:
+        """Build the production estimates from a production estimates payload."""
+        return {
+            estimate["reference"]: ProductionEstimate(
+                production=estimate["production"],
+                production_index=estimate["production_index"],
+            )
+            for estimate in data
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class SunSnapshot:
+    """Position of the sun at a plant.
+
+    Kept apart from the solar snapshot as it changes on every refresh.
+    """
+
+    elevation: float | None
+    stale: frozenset[str] = frozenset()
+    version: int = field(default=0, compare=False)
+
+
+@dataclass(frozen=True, slots=True)
+class TrackerSnapshot:
+    """Status of a tracker."""
+
+    id: int
+    is_synchronised: bool | None
+    latest_synchronisation: datetime | None
+    production: float | None
+    production_time: datetime | None
+    max_wind_speed: float | None
+    average_wind_speed: float | None
+    wind_speed_time: datetime | None
+    status_reference: str | None
+    stale: frozenset[str] = frozenset()
+    version: int = field(default=0, compare=False)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> TrackerSnapshot:
+        """Build the snapshot from a tracker status payload."""
+        production = data.get("data") or {}
+        control = data.get("control") or {}
+        return cls(
+            id=data["id"],
+            is_synchronised=data.get("is_synchronised"),
+            latest_synchronisation=as_datetime(data.get("latest_synchronisation")),
+            production=production.get("production"),
+            production_time=as_datetime(production.get("date")),
+            max_wind_speed=control.get("max_wind_speed"),
+            average_wind_speed=control.get("average_wind_speed"),
+            wind_speed_time=as_datetime(control.get("date")),
+            status_reference=(data.get("status_type") or {}).get("reference"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class MeterSnapshot:
+    """Status of a meter."""
+
+    id: int
+    is_synchronised: bool | None
+    latest_synchronisation: datetime | None
+    consumption: float | None
+    consumption_time: datetime | None
+    stale: frozenset[str] = frozenset()
+    version: int = field(default=0, compare=False)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> MeterSnapshot:
+        """Build the snapshot from a meter status payload."""
+        return cls(
+            id=data["id"],
+            is_synchronised=data.get("is_synchronised"),
+            latest_synchronisation=as_datetime(data.get("latest_synchronisation")),
+            consumption=data.get("consumption"),
+            consumption_time=as_datetime(data.get("date")),
+        )
@@ -13,7 +13,14 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfEnergy, UnitOfPower, UnitOfSpeed
+from homeassistant.const import (
+    DEGREE,
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfEnergy,
+    UnitOfPower,
+    UnitOfSpeed,
+)
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -34,7 +41,9 @@ from .const import (
     COORDINATOR_SOLAR,
     COORDINATOR_TRACKERS,
     COORDINATOR_METER,
+    SOLAR_DEVICE_IDENTIFIER,
 )
+from .util import as_date, as_datetime
 
 
 @dataclass
@@ -51,23 +60,41 @@ class LumiooSensorEntityDescription(
     """Describes Lumioo sensor entity."""
 
     attributes_fn: Callable[[Any], dict[Any, StateType]] | None = None
+    # Part of the snapshot the state comes from, see LumiooConnector
+    part: str = "status"
+    # Connector data holding the snapshot, the one of the device when None
+    data_key: str | None = None
 
 
 _LOGGER = logging.getLogger(__name__)
 
+
 PLANT_SENSORS = [
     LumiooSensorEntityDescription(
         key="synchronised_data",
         name="Synchronised data",
-        state_fn=lambda data: data["main"]["is_synchronised"],
-        attributes_fn=lambda data: {
-            "time": data["main"]["latest_synchronisation"],
-        },
+        state_fn=lambda data: data.is_synchronised,
+    ),
+    LumiooSensorEntityDescription(
+        key="latest_synchronisation",
+        name="Latest synchronisation",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_fn=lambda data: data.latest_synchronisation,
+    ),
+    LumiooSensorEntityDescription(
+        key="energy_day",
+        name="Energy day",
+        device_class=SensorDeviceClass.DATE,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        part="energy_day",
+        state_fn=lambda data: data.energy_day.day,
     ),
     LumiooSensorEntityDescription(
         key="status_reference",
         name="Status reference",
-        state_fn=lambda data: data["main"]["status_type"]["reference"],
+        state_fn=lambda data: data.status_reference,
     ),
     LumiooSensorEntityDescription(
         key="today_production",
@@ -75,10 +102,8 @@ PLANT_SENSORS = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        state_fn=lambda data: data["energy_day"]["production"],
-        attributes_fn=lambda data: {
-            "time": data["energy_day"]["date"],
-        },
+        part="energy_day",
+        state_fn=lambda data: data.energy_day.production,
     ),
     LumiooSensorEntityDescription(
         key="today_consumption",
@@ -86,10 +111,8 @@ PLANT_SENSORS = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        state_fn=lambda data: data["energy_day"]["consumption"],
-        attributes_fn=lambda data: {
-            "time": data["energy_day"]["date"],
-        },
+        part="energy_day",
+        state_fn=lambda data: data.energy_day.consumption,
     ),
     LumiooSensorEntityDescription(
         key="today_auto_consumption",
@@ -97,10 +120,8 @@ PLANT_SENSORS = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        state_fn=lambda data: data["energy_day"]["auto_consumption"],
-        attributes_fn=lambda data: {
-            "time": data["energy_day"]["date"],
-        },
+        part="energy_day",
+        state_fn=lambda data: data.energy_day.auto_consumption,
     ),
     LumiooSensorEntityDescription(
         key="today_grid_consumption",
@@ -108,10 +129,8 @@ PLANT_SENSORS = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        state_fn=lambda data: data["energy_day"]["grid_consumption"],
-        attributes_fn=lambda data: {
-            "time": data["energy_day"]["date"],
-        },
+        part="energy_day",
+        state_fn=lambda data: data.energy_day.grid_consumption,
     ),
     LumiooSensorEntityDescription(
         key="today_grid_restitution",
@@ -119,10 +138,8 @@ PLANT_SENSORS = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        state_fn=lambda data: data["energy_day"]["grid_restitution"],
-        attributes_fn=lambda data: {
-            "time": data["energy_day"]["date"],
-        },
+        part="energy_day",
+        state_fn=lambda data: data.energy_day.grid_restitution,
     ),
 ]
 
@@ -131,13 +148,27 @@ SOLAR_SENSORS = [
         key="sunrise",
         name="Sunrise",
         device_class=SensorDeviceClass.TIMESTAMP,
-        state_fn=lambda data: data["times"]["sunrise"],
+        state_fn=lambda data: data.sunrise,
     ),
     LumiooSensorEntityDescription(
         key="sunset",
         name="Sunset",
         device_class=SensorDeviceClass.TIMESTAMP,
-        state_fn=lambda data: data["times"]["sunset"],
+        state_fn=lambda data: data.sunset,
+    ),
+    LumiooSensorEntityDescription(
+        key="solar_noon",
+        name="Solar noon",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        state_fn=lambda data: data.solar_noon,
+    ),
+    LumiooSensorEntityDescription(
+        key="sun_elevation",
+        name="Sun elevation",
+        native_unit_of_measurement=DEGREE,
+        state_class=SensorStateClass.MEASUREMENT,
+        data_key="sun",
+        state_fn=lambda data: data.elevation,
     ),
     LumiooSensorEntityDescription(
         key="forecast today morning",
@@ -145,11 +176,10 @@ SOLAR_SENSORS = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        state_fn=lambda data: data["production_estimates"]["today_morning"][
-            "production"
-        ],
+        part="production_estimates",
+        state_fn=lambda data: data.production_estimates["today_morning"].production,
         attributes_fn=lambda data: {
-            "index": data["production_estimates"]["today_morning"]["production_index"],
+            "index": data.production_estimates["today_morning"].production_index,
         },
     ),
     LumiooSensorEntityDescription(
@@ -158,13 +188,10 @@ SOLAR_SENSORS = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        state_fn=lambda data: data["production_estimates"]["today_afternoon"][
-            "production"
-        ],
+        part="production_estimates",
+        state_fn=lambda data: data.production_estimates["today_afternoon"].production,
         attributes_fn=lambda data: {
-            "index": data["production_estimates"]["today_afternoon"][
-                "production_index"
-            ],
+            "index": data.production_estimates["today_afternoon"].production_index,
         },
     ),
     LumiooSensorEntityDescription(
@@ -173,13 +200,10 @@ SOLAR_SENSORS = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        state_fn=lambda data: data["production_estimates"]["tomorrow_morning"][
-            "production"
-        ],
+        part="production_estimates",
+        state_fn=lambda data: data.production_estimates["tomorrow_morning"].production,
         attributes_fn=lambda data: {
-            "index": data["production_estimates"]["tomorrow_morning"][
-                "production_index"
-            ],
+            "index": data.production_estimates["tomorrow_morning"].production_index,
         },
     ),
     LumiooSensorEntityDescription(
@@ -188,25 +212,43 @@ SOLAR_SENSORS = [
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        state_fn=lambda data: data["production_estimates"]["tomorrow_afternoon"][
-            "production"
-        ],
+        part="production_estimates",
+        state_fn=lambda data: data.production_estimates[
+            "tomorrow_afternoon"
+        ].production,
         attributes_fn=lambda data: {
-            "index": data["production_estimates"]["tomorrow_afternoon"][
-                "production_index"
-            ],
+            "index": data.production_estimates["tomorrow_afternoon"].production_index,
         },
     ),
+    LumiooSensorEntityDescription(
+        key="forecast_mape",
+        name="Solar forecast error",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        state_fn=lambda data: data.forecast_mape,
+    ),
+    LumiooSensorEntityDescription(
+        key="forecast_bias",
+        name="Solar forecast bias",
+        native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
+        state_class=SensorStateClass.MEASUREMENT,
+        state_fn=lambda data: data.forecast_bias,
+    ),
 ]
 
 TRACKER_SENSORS = [
     LumiooSensorEntityDescription(
         key="synchronised_data",
         name="Synchronised data",
-        state_fn=lambda data: data["is_synchronised"],
-        attributes_fn=lambda data: {
-            "time": data["latest_synchronisation"],
-        },
+        state_fn=lambda data: data.is_synchronised,
+    ),
+    LumiooSensorEntityDescription(
+        key="latest_synchronisation",
+        name="Latest synchronisation",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_fn=lambda data: data.latest_synchronisation,
     ),
     LumiooSensorEntityDescription(
         key="production",
@@ -214,10 +256,15 @@ TRACKER_SENSORS = [
         device_class=SensorDeviceClass.POWER,
         native_unit_of_measurement=UnitOfPower.WATT,
         state_class=SensorStateClass.MEASUREMENT,
-        state_fn=lambda data: data["data"]["production"],
-        attributes_fn=lambda data: {
-            "time": data["data"]["date"],
-        },
+        state_fn=lambda data: data.production,
+    ),
+    LumiooSensorEntityDescription(
+        key="production_time",
+        name="Production time",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_fn=lambda data: data.production_time,
     ),
     LumiooSensorEntityDescription(
         key="wind_speed_max",
@@ -225,10 +272,7 @@ TRACKER_SENSORS = [
         device_class=SensorDeviceClass.WIND_SPEED,
         native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
         state_class=SensorStateClass.MEASUREMENT,
-        state_fn=lambda data: data["control"]["max_wind_speed"],
-        attributes_fn=lambda data: {
-            "time": data["control"]["date"],
-        },
+        state_fn=lambda data: data.max_wind_speed,
     ),
     LumiooSensorEntityDescription(
         key="wind_speed_average",
@@ -236,15 +280,20 @@ TRACKER_SENSORS = [
         device_class=SensorDeviceClass.WIND_SPEED,
         native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
         state_class=SensorStateClass.MEASUREMENT,
-        state_fn=lambda data: data["control"]["average_wind_speed"],
-        attributes_fn=lambda data: {
-            "time": data["control"]["date"],
-        },
+        state_fn=lambda data: data.average_wind_speed,
+    ),
+    LumiooSensorEntityDescription(
+        key="wind_speed_time",
+        name="Wind speed time",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_fn=lambda data: data.wind_speed_time,
     ),
     LumiooSensorEntityDescription(
         key="status_reference",
         name="Status reference",
-        state_fn=lambda data: data["status_type"]["reference"],
+        state_fn=lambda data: data.status_reference,
     ),
 ]
 
@@ -252,10 +301,15 @@ METER_SENSORS = [
     LumiooSensorEntityDescription(
         key="synchronised_data",
         name="Synchronised data",
-        state_fn=lambda data: data["is_synchronised"],
-        attributes_fn=lambda data: {
-            "time": data["latest_synchronisation"],
-        },
+        state_fn=lambda data: data.is_synchronised,
+    ),
+    LumiooSensorEntityDescription(
+        key="latest_synchronisation",
+        name="Latest synchronisation",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_fn=lambda data: data.latest_synchronisation,
     ),
     LumiooSensorEntityDescription(
         key="consumption",
@@ -263,10 +317,15 @@ METER_SENSORS = [
         device_class=SensorDeviceClass.POWER,
         native_unit_of_measurement=UnitOfPower.WATT,
         state_class=SensorStateClass.MEASUREMENT,
-        state_fn=lambda data: data["consumption"],
-        attributes_fn=lambda data: {
-            "time": data["date"],
-        },
+        state_fn=lambda data: data.consumption,
+    ),
+    LumiooSensorEntityDescription(
+        key="consumption_time",
+        name="Consumption time",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_fn=lambda data: data.consumption_time,
     ),
 ]
 
@@ -285,48 +344,90 @@ async def async_setup_entry(
     coordinator_trackers: DataUpdateCoordinator = data[COORDINATOR_TRACKERS]
     coordinator_meter: DataUpdateCoordinator = data[COORDINATOR_METER]
 
+    plant_device_id = lumioo.plant_id
+
     entities: list[SensorEntity] = []
 
+    def add_device_sensors(
+        data_type: str,
+        tracker_id: str,
+        device_id,
+        descriptions: list[LumiooSensorEntityDescription],
+        coordinator: DataUpdateCoordinator,
+    ) -> None:
+        """Create the sensors of a device, sharing a single device info."""
+        device_info = _build_device_info(
+            data_type, tracker_id, device_id, plant_device_id
+        )
+        unique_id_prefix = f"lumioo {device_id} {data_type}"
+
+        entities.extend(
+            LumiooSensor(
+                lumioo,
+                data_type,
+                tracker_id,
+                entity_description,
+                coordinator,
+                device_info,
+                f"{unique_id_prefix} {entity_description.key}",
+            )
+            for entity_description in descriptions
+        )
+
     # Create plant sensors
-    entities.extend(
-        [
-            LumiooSensor(lumioo, "plant", "", entity_description, coordinator_plant)
-            for entity_description in PLANT_SENSORS
-        ]
-    )
+    add_device_sensors("plant", "", plant_device_id, PLANT_SENSORS, coordinator_plant)
 
-    # Create solar sensors
-    entities.extend(
-        [
-            LumiooSensor(lumioo, "solar", "", entity_description, coordinator_solar)
-            for entity_description in SOLAR_SENSORS
-        ]
-    )
+    # Create solar sensors, the forecast being the one of the plant
+    add_device_sensors("solar", "", plant_device_id, SOLAR_SENSORS, coordinator_solar)
 
     # Create trackers sensors
     for tracker in lumioo.trackers:
-        entities.extend(
-            [
-                LumiooSensor(
-                    lumioo,
-                    "trackers",
-                    str(tracker.id),
-                    entity_description,
-                    coordinator_trackers,
-                )
-                for entity_description in TRACKER_SENSORS
-            ]
+        tracker_id = str(tracker.id)
+        add_device_sensors(
+            "trackers",
+            tracker_id,
+            tracker.id,
+            TRACKER_SENSORS,
+            coordinator_trackers,
         )
 
     # Create meter sensors
-    entities.extend(
-        [
-            LumiooSensor(lumioo, "meter", "", entity_description, coordinator_meter)
-            for entity_description in METER_SENSORS
-        ]
+    add_device_sensors(
+        "meter", "", lumioo.main_meter_id, METER_SENSORS, coordinator_meter
     )
 
-    async_add_entities(entities, True)
+    # Data was fetched during setup, entities are registered in a single batch
+    # and take their initial state from it instead of each requesting a refresh.
+    async_add_entities(entities)
+
+
+def _build_device_info(
+    data_type: str, tracker_id: str, device_id, plant_device_id
+) -> DeviceInfo:
+    """Return the device_info shared by all the sensors of a device."""
+    device_info = DeviceInfo(
+        name=DEVICE_TYPES[data_type],
+        manufacturer=DEFAULT_NAME,
+        model=DEVICE_TYPES[data_type],
+        identifiers={(DOMAIN, device_id)},
+    )
+    if data_type == "plant":
+        device_info["configuration_url"] = "https://mylumioo.com/plant/plant-settings"
+    if data_type == "solar":
+        device_info["entry_type"] = DeviceEntryType.SERVICE
+        device_info["identifiers"] = {
+            (DOMAIN, SOLAR_DEVICE_IDENTIFIER.format(plant_device_id))
+        }
+        device_info["via_device"] = (DOMAIN, plant_device_id)
+    if data_type == "trackers":
+        device_info["name"] = f"{DEVICE_TYPES[data_type]} {device_id}"
+        device_info[
+            "configuration_url"
+        ] = f"https://mylumioo.com/plant/tracker-settings/{tracker_id}"
+        device_info["via_device"] = (DOMAIN, plant_device_id)
+    if data_type == "meter":
+        device_info["via_device"] = (DOMAIN, plant_device_id)
+    return device_info
 
 
 class LumiooSensor(CoordinatorEntity, RestoreEntity, SensorEntity):
@@ -339,8 +440,10 @@ class LumiooSensor(CoordinatorEntity, RestoreEntity, SensorEntity):
         lumioo,
         data_type: str,
         tracker_id: str,
-        entity_description: SensorEntityDescription,
+        entity_description: LumiooSensorEntityDescription,
         coordinator: DataUpdateCoordinator,
+        device_info: DeviceInfo,
+        unique_id: str,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
@@ -351,34 +454,16 @@ class LumiooSensor(CoordinatorEntity, RestoreEntity, SensorEntity):
         self.tracker_id = tracker_id
         self._state = None
         self._available = False
+        self._snapshot_version: int | None = None
 
-        self.device_id = None
-        if self.data_type == "plant":
-            self.device_id = self.lumioo.data[self.data_type]["main"]["id"]
-        if self.data_type == "trackers":
-            self.device_id = self.lumioo.data[self.data_type][self.tracker_id]["id"]
-        if self.data_type == "meter":
-            self.device_id = self.lumioo.data[self.data_type]["id"]
-
+        self._attr_unique_id = unique_id
+        self._attr_device_info = device_info
         self._attr_device_class = entity_description.device_class
         self._attr_state_class = entity_description.state_class
         self._attr_native_unit_of_measurement = (
             entity_description.native_unit_of_measurement
         )
 
-    @property
-    def unique_id(self) -> str:
-        """Device Uniqueid."""
-        unique_id = f"lumioo {self.data_type} {self.entity_description.key}"
-        if self.device_id is not None:
-            unique_id = f"lumioo {str(self.device_id)} {self.data_type} {self.entity_description.key}"
-        return unique_id
-
-    @property
-    def name(self) -> str | None:
-        """Entity Name."""
-        return self.entity_description.name
-
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
@@ -389,56 +474,53 @@ class LumiooSensor(CoordinatorEntity, RestoreEntity, SensorEntity):
         """Get the latest reading."""
         return self._state
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device_info of the device."""
-        device_info = DeviceInfo(
-            name=DEVICE_TYPES[self.data_type],
-            manufacturer=DEFAULT_NAME,
-            model=DEVICE_TYPES[self.data_type],
-            identifiers={(DOMAIN, self.device_id)},
-        )
-        if self.data_type == "plant":
-            device_info[
-                "configuration_url"
-            ] = "https://mylumioo.com/plant/plant-settings"
-        if self.data_type == "solar":
-            device_info["entry_type"] = DeviceEntryType.SERVICE
-            device_info["identifiers"] = {(DOMAIN, self.data_type)}
-            device_info["via_device"] = (DOMAIN, 2180)
-        if self.data_type == "trackers":
-            device_info["name"] = f"{DEVICE_TYPES[self.data_type]} {self.device_id}"
-            device_info[
-                "configuration_url"
-            ] = f"https://mylumioo.com/plant/tracker-settings/{self.tracker_id}"
-            device_info["via_device"] = (DOMAIN, 2180)
-        if self.data_type == "meter":
-            device_info["via_device"] = (DOMAIN, 2180)
-        return device_info
+    def _snapshot(self):
+        """Return the latest snapshot the sensor reads from."""
+        snapshot = self.lumioo.data[self.entity_description.data_key or self.data_type]
+        if len(self.tracker_id) > 0:
+            snapshot = snapshot.get(self.tracker_id)
+        return snapshot
+
+    def _update_from_data(self) -> bool:
+        """Update the state from the connector data, return False on failure."""
+        snapshot = self._snapshot()
+        if snapshot is None:
+            _LOGGER.debug("No %s data for %s", self.data_type, self.unique_id)
+            return False
+
+        try:
+            self._state = self.entity_description.state_fn(snapshot)
+            if self.entity_description.attributes_fn is not None:
+                self._attr_extra_state_attributes = (
+                    self.entity_description.attributes_fn(snapshot)
+                )
+        except Exception as exc:  # pylint: disable=broad-except
+            _LOGGER.exception("Unexpected exception")
+            _LOGGER.debug(exc)
+            return False
+        self._snapshot_version = snapshot.version
+        return True
 
     @callback
     def _state_update(self):
         """Call when the coordinator has an update."""
-        self._available = self.coordinator.last_update_success
-        if self._available:
-            try:
-                lumioo_data = self.lumioo.data[self.data_type]
-                if len(self.tracker_id) > 0:
-                    lumioo_data = lumioo_data[self.tracker_id]
-            except KeyError as exc:
-                _LOGGER.debug(exc)
+        available = self.coordinator.last_update_success
+        if available:
+            snapshot = self._snapshot()
+            if (
+                self._available
+                and snapshot is not None
+                and snapshot.version == self._snapshot_version
+            ):
+                # Nothing changed since the last written state
                 return
-
-            try:
-                self._state = self.entity_description.state_fn(lumioo_data)
-                if self.entity_description.attributes_fn is not None:
-                    self._attr_extra_state_attributes = (
-                        self.entity_description.attributes_fn(lumioo_data)
-                    )
-            except Exception as exc:  # pylint: disable=broad-except
-                _LOGGER.exception("Unexpected exception")
-                _LOGGER.debug(exc)
+            if snapshot is not None and self.entity_description.part in snapshot.stale:
+                # Keep the last value, its data could not be refreshed in time
+                self._snapshot_version = snapshot.version
+                available = False
+            elif not self._update_from_data():
                 return
+        self._available = available
         self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
@@ -449,8 +531,16 @@ class LumiooSensor(CoordinatorEntity, RestoreEntity, SensorEntity):
         # we added the entity, there is no need to restore
         # state.
         if self.coordinator.last_update_success:
+            self._available = (
+                self._update_from_data()
+                and self.entity_description.part not in self._snapshot().stale
+            )
             return
 
         if last_state := await self.async_get_last_state():
             self._state = last_state.state
+            if self.device_class == SensorDeviceClass.TIMESTAMP:
+                self._state = as_datetime(last_state.state)
+            elif self.device_class == SensorDeviceClass.DATE:
+                self._state = as_date(last_state.state)
             self._available = True
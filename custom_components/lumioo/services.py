@@ -0,0 +1,172 @@
+"""Services for the Lumioo integration."""
+from __future__ import annotations
+
+import logging
+import os
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    DATA,
+    COORDINATOR_PLANT,
+    COORDINATOR_SOLAR,
+    COORDINATOR_TRACKERS,
+    COORDINATOR_METER,
+    SOLAR_DEVICE_IDENTIFIER,
+    DATASET_ENERGY_DAYS,
+    DATASET_TRACKER_SAMPLES,
+    FORMAT_CSV,
+    FORMAT_PARQUET,
+    EXPORT_DIRECTORY,
+)
+from .export import (
+    ENERGY_DAY_FIELDS,
+    TRACKER_SAMPLE_FIELDS,
+    async_export,
+    async_iter_energy_days,
+    async_iter_tracker_samples,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_EXPORT = "export"
+SERVICE_REFRESH = "refresh"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_DATASET = "dataset"
+ATTR_START_DATE = "start_date"
+ATTR_END_DATE = "end_date"
+ATTR_FORMAT = "format"
+ATTR_FILENAME = "filename"
+
+SERVICE_EXPORT_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_DATASET): vol.In(
+            [DATASET_ENERGY_DAYS, DATASET_TRACKER_SAMPLES]
+        ),
+        vol.Required(ATTR_START_DATE): cv.date,
+        vol.Optional(ATTR_END_DATE): cv.date,
+        vol.Optional(ATTR_FORMAT, default=FORMAT_CSV): vol.In(
+            [FORMAT_CSV, FORMAT_PARQUET]
+        ),
+        vol.Optional(ATTR_FILENAME): cv.string,
+    }
+)
+
+
+def _async_device_coordinators(
+    hass: HomeAssistant, device: dr.DeviceEntry
+) -> list[DataUpdateCoordinator]:
+    """Return the coordinators refreshing the data of a Lumioo device."""
+    coordinators = []
+    for entry_id in device.config_entries:
+        if (entry_data := hass.data.get(DOMAIN, {}).get(entry_id)) is None:
+            continue
+        lumioo = entry_data[DATA]
+        trackers = {str(tracker.id) for tracker in lumioo.trackers}
+
+        for domain, identifier in device.identifiers:
+            if domain != DOMAIN:
+                continue
+            identifier = str(identifier)
+            if identifier == str(lumioo.plant_id):
+                coordinators.extend(
+                    entry_data[key]
+                    for key in (
+                        COORDINATOR_PLANT,
+                        COORDINATOR_SOLAR,
+                        COORDINATOR_TRACKERS,
+                        COORDINATOR_METER,
+                    )
+                )
+            elif identifier == SOLAR_DEVICE_IDENTIFIER.format(lumioo.plant_id):
+                coordinators.append(entry_data[COORDINATOR_SOLAR])
+            elif identifier in trackers:
+                coordinators.append(entry_data[COORDINATOR_TRACKERS])
+            elif identifier == str(lumioo.main_meter_id):
+                coordinators.append(entry_data[COORDINATOR_METER])
+    return coordinators
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Lumioo services."""
+
+    async def async_handle_refresh(call: ServiceCall) -> None:
+        """Request a refresh of the targeted plants and trackers.
+
+        Requests go through the coordinator debouncers, so bursts of calls
+        result in a single API round per subsystem.
+        """
+        device_registry = dr.async_get(hass)
+        entity_registry = er.async_get(hass)
+
+        selected = async_extract_referenced_entity_ids(hass, call)
+        device_ids = set(selected.referenced_devices)
+        for entity_id in selected.referenced | selected.indirectly_referenced:
+            if (entity := entity_registry.async_get(entity_id)) is not None:
+                if entity.platform == DOMAIN and entity.device_id is not None:
+                    device_ids.add(entity.device_id)
+
+        coordinators: dict[int, DataUpdateCoordinator] = {}
+        for device_id in device_ids:
+            if (device := device_registry.async_get(device_id)) is None:
+                continue
+            for coordinator in _async_device_coordinators(hass, device):
+                coordinators[id(coordinator)] = coordinator
+
+        for coordinator in coordinators.values():
+            await coordinator.async_request_refresh()
+
+    async def async_handle_export(call: ServiceCall) -> None:
+        """Export plant or tracker history to a new file in the export directory."""
+        entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+        if entry_id not in hass.data.get(DOMAIN, {}):
+            raise HomeAssistantError(f"Lumioo config entry {entry_id} is not loaded")
+        lumioo = hass.data[DOMAIN][entry_id][DATA]
+
+        dataset = call.data[ATTR_DATASET]
+        file_format = call.data[ATTR_FORMAT]
+        start = call.data[ATTR_START_DATE]
+        end = call.data.get(ATTR_END_DATE, dt_util.now().date())
+        if end < start:
+            raise HomeAssistantError("The end date is before the start date")
+
+        filename = call.data.get(
+            ATTR_FILENAME,
+            f"lumioo_{lumioo.plant_id}_{dataset}_{start}_{end}.{file_format}",
+        )
+        if os.path.basename(filename) != filename:
+            raise HomeAssistantError("The file name must not contain a directory")
+        if not filename.endswith(f".{file_format}"):
+            raise HomeAssistantError(f"The file name must end with .{file_format}")
+        path = hass.config.path(EXPORT_DIRECTORY, filename)
+
+        if dataset == DATASET_ENERGY_DAYS:
+            rows = async_iter_energy_days(lumioo, start, end)
+            fields = ENERGY_DAY_FIELDS
+        else:
+            rows = async_iter_tracker_samples(lumioo, start, end)
+            fields = TRACKER_SAMPLE_FIELDS
+
+        count = await async_export(hass, rows, fields, path, file_format)
+        _LOGGER.info("Exported %d %s rows to %s", count, dataset, path)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_EXPORT, async_handle_export, schema=SERVICE_EXPORT_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH,
+        async_handle_refresh,
+        schema=cv.make_entity_service_schema({}),
+    )
@@ -0,0 +1,117 @@
+"""Local computation of the sun position for a Lumioo plant.
+
+Implements the NOAA solar calculator equations, accurate to about a minute
+for sunrise and sunset between the polar circles.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+import math
+
+# Zenith of the sun center at sunrise and sunset, including refraction
+SUNRISE_ZENITH = 90.833
+
+
+@dataclass(frozen=True)
+class SolarTimes:
+    """Sun events of a day, in UTC."""
+
+    sunrise: datetime | None
+    sunset: datetime | None
+    solar_noon: datetime
+
+
+def _julian_century(moment: datetime) -> float:
+    """Return the Julian century of a moment."""
+    julian_day = moment.timestamp() / 86400.0 + 2440587.5
+    return (julian_day - 2451545.0) / 36525.0
+
+
+def _declination_and_equation_of_time(moment: datetime) -> tuple[float, float]:
+    """Return the sun declination in degrees and the equation of time in minutes."""
+    t = _julian_century(moment)
+
+    mean_longitude = math.radians(
+        (280.46646 + t * (36000.76983 + t * 0.0003032)) % 360
+    )
+    mean_anomaly = math.radians(357.52911 + t * (35999.05029 - 0.0001537 * t))
+    eccentricity = 0.016708634 - t * (0.000042037 + 0.0000001267 * t)
+
+    center = (
+        math.sin(mean_anomaly) * (1.914602 - t * (0.004817 + 0.000014 * t))
+        + math.sin(2 * mean_anomaly) * (0.019993 - 0.000101 * t)
+        + math.sin(3 * mean_anomaly) * 0.000289
+    )
+    omega = math.radians(125.04 - 1934.136 * t)
+    apparent_longitude = math.radians(
+        math.degrees(mean_longitude) + center - 0.00569 - 0.00478 * math.sin(omega)
+    )
+    mean_obliquity = (
+        23 + (26 + (21.448 - t * (46.815 + t * (0.00059 - t * 0.001813))) / 60) / 60
+    )
+    obliquity = math.radians(mean_obliquity + 0.00256 * math.cos(omega))
+
+    declination = math.asin(math.sin(obliquity) * math.sin(apparent_longitude))
+
+    y = math.tan(obliquity / 2) ** 2
+    equation_of_time = 4 * math.degrees(
+        y * math.sin(2 * mean_longitude)
+        - 2 * eccentricity * math.sin(mean_anomaly)
+        + 4 * eccentricity * y * math.sin(mean_anomaly) * math.cos(2 * mean_longitude)
+        - 0.5 * y * y * math.sin(4 * mean_longitude)
+        - 1.25 * eccentricity * eccentricity * math.sin(2 * mean_anomaly)
+    )
+
+    return math.degrees(declination), equation_of_time
+
+
+@lru_cache(maxsize=8)
+def solar_times(day: date, latitude: float, longitude: float) -> SolarTimes:
+    """Return sunrise, sunset and solar noon of a day at a location.
+
+    Sunrise and sunset are None during polar day or night.
+    """
+    midnight = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+
+    # Refine the solar noon with the sun parameters at the estimated noon
+    noon_minutes = 720 - 4 * longitude
+    for _ in range(2):
+        declination, equation_of_time = _declination_and_equation_of_time(
+            midnight + timedelta(minutes=noon_minutes)
+        )
+        noon_minutes = 720 - 4 * longitude - equation_of_time
+    solar_noon = midnight + timedelta(minutes=noon_minutes)
+
+    lat = math.radians(latitude)
+    decl = math.radians(declination)
+    cos_hour_angle = math.cos(math.radians(SUNRISE_ZENITH)) / (
+        math.cos(lat) * math.cos(decl)
+    ) - math.tan(lat) * math.tan(decl)
+    if not -1 <= cos_hour_angle <= 1:
+        return SolarTimes(sunrise=None, sunset=None, solar_noon=solar_noon)
+
+    half_day = timedelta(minutes=4 * math.degrees(math.acos(cos_hour_angle)))
+    return SolarTimes(
+        sunrise=solar_noon - half_day,
+        sunset=solar_noon + half_day,
+        solar_noon=solar_noon,
+    )
+
+
+def solar_elevation(moment: datetime, latitude: float, longitude: float) -> float:
+    """Return the geometric elevation of the sun in degrees at a moment."""
+    moment = moment.astimezone(timezone.utc)
+    declination, equation_of_time = _declination_and_equation_of_time(moment)
+
+    minutes = moment.hour * 60 + moment.minute + moment.second / 60
+    true_solar_time = (minutes + equation_of_time + 4 * longitude) % 1440
+    hour_angle = math.radians(true_solar_time / 4 - 180)
+
+    lat = math.radians(latitude)
+    decl = math.radians(declination)
+    cos_zenith = math.sin(lat) * math.sin(decl) + math.cos(lat) * math.cos(
+        decl
+    ) * math.cos(hour_angle)
+    return 90 - math.degrees(math.acos(max(-1.0, min(1.0, cos_zenith))))
@@ -0,0 +1,23 @@
+"""Helpers for the Lumioo integration."""
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from homeassistant.util import dt as dt_util
+
+
+def as_datetime(value: str | None) -> datetime | None:
+    """Convert a time returned by the Lumioo API to an aware datetime."""
+    if value is None:
+        return None
+    parsed = dt_util.parse_datetime(value)
+    if parsed is not None and parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    return parsed
+
+
+def as_date(value: str | None) -> date | None:
+    """Convert a date returned by the Lumioo API."""
+    if value is None:
+        return None
+    return dt_util.parse_date(value)
@@ -0,0 +1,48 @@
+"""Benchmark the setup of a Lumioo plant against the number of trackers.
+
+Usage: pytest tests/bench_sensor_setup.py -s
+
+The benchmark is not collected with the tests. Each run sets up the config
+entry of the synthetic plant, its trackers repeated as many times as
+requested, in a Home Assistant test instance: the connector setup, the
+first refresh of the coordinators and the creation and registration of the
+entities of every platform are timed.
+"""
+from __future__ import annotations
+
+import logging
+import time
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from .common import ReplayLumiooHubAPI
+
+
+@pytest.mark.parametrize("tracker_count", [10, 100, 1000, 5000])
+async def test_setup_time(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    replay_api: ReplayLumiooHubAPI,
+    config_entry: MockConfigEntry,
+    tracker_count: int,
+) -> None:
+    """Time the setup of a plant of tracker_count trackers."""
+    # Every registered entity is logged at info level
+    caplog.set_level(logging.WARNING)
+
+    start = time.process_time()
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    duration = time.process_time() - start
+
+    entity_count = len(
+        er.async_entries_for_config_entry(er.async_get(hass), config_entry.entry_id)
+    )
+    print(
+        f"\n{tracker_count:>5} trackers {entity_count:>6} entities "
+        f"{duration * 1000:>9.1f} ms {duration / entity_count * 1e6:>7.1f} us/entity"
+    )
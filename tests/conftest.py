@@ -0,0 +1,83 @@
+"""Fixtures for the Lumioo tests."""
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Generator
+import sys
+from types import ModuleType
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.lumioo.const import CONF_PLANT_ID, DOMAIN
+
+from .common import ACCESS_TOKEN, PLANT_ID, ReplayLumiooHubAPI, load_fixture
+
+# Time of the synthetic plant, its sun events match the Home Assistant test
+# location
+FIXTURE_TIME = "2023-06-21 10:00:00+00:00"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable the custom integrations in all the tests."""
+    yield
+
+
+@pytest.fixture
+def expected_lingering_timers() -> bool:
+    """Allow the delayed save of the forecast accuracy to outlive a test."""
+    return True
+
+
+@pytest.fixture
+def tracker_count() -> int | None:
+    """Return the number of trackers to replay, None for the fixture ones."""
+    return None
+
+
+@pytest.fixture
+def replay_api(
+    freezer, monkeypatch: pytest.MonkeyPatch, tracker_count
+) -> ReplayLumiooHubAPI:
+    """Replay the synthetic plant instead of calling the Lumioo API."""
+    freezer.move_to(FIXTURE_TIME)
+    api = ReplayLumiooHubAPI(load_fixture("synthetic_plant.json"), tracker_count)
+    client = ModuleType("custom_components.lumioo.client")
+    client.create_api = lambda session, access_token: api
+    # Only the client module is replaced, the modules imported by the
+    # integration are left loaded
+    monkeypatch.setitem(sys.modules, client.__name__, client)
+    return api
+
+
+@pytest.fixture
+def config_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Return the config entry of the synthetic plant."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Home",
+        unique_id=str(PLANT_ID),
+        data={"access_token": ACCESS_TOKEN, CONF_PLANT_ID: PLANT_ID},
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+def state_writes() -> Generator[Counter[str], None, None]:
+    """Count the state writes of every entity."""
+    writes: Counter[str] = Counter()
+    async_write_ha_state = Entity.async_write_ha_state
+
+    def _async_write_ha_state(entity: Entity) -> None:
+        writes[entity.entity_id] += 1
+        async_write_ha_state(entity)
+
+    with patch.object(Entity, "async_write_ha_state", _async_write_ha_state):
+        yield writes
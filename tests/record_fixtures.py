@@ -0,0 +1,95 @@
+"""Record the responses of the Lumioo API as a test fixture.
+
+Usage: python -m tests.record_fixtures ACCESS_TOKEN PLANT_ID [OUTPUT]
+
+Credentials, personal data and the plant location are left out of the
+recorded responses, the tests use the Home Assistant location instead.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+from datetime import date, timedelta
+import json
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+from lumioo.auth import Auth
+from lumioo.core import LumiooHubAPI
+
+from .common import FIXTURES
+
+REDACTED_KEYS = {"access_token", "address", "email", "latitude", "longitude"}
+
+
+def _to_json(value: Any) -> Any:
+    """Convert a response to JSON values, dropping the redacted keys."""
+    if dataclasses.is_dataclass(value):
+        value = dataclasses.asdict(value)
+    elif hasattr(value, "__dict__"):
+        value = vars(value)
+    if isinstance(value, dict):
+        return {
+            key: _to_json(item)
+            for key, item in value.items()
+            if key not in REDACTED_KEYS and not key.startswith("_")
+        }
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    return value
+
+
+async def async_record(access_token: str, plant_id: int) -> dict[str, Any]:
+    """Fetch the responses used by a refresh of every subsystem of a plant."""
+    today = date.today()
+    async with aiohttp.ClientSession() as session:
+        api = LumiooHubAPI(Auth(session, access_token))
+
+        plant = await api.async_get_plant(plant_id)
+        trackers = await api.async_get_trackers(plant_id)
+        return _to_json(
+            {
+                "plant": plant,
+                "trackers": trackers,
+                "meter": await api.async_get_meter(plant.main_meter),
+                "plant_status": await api.async_get_plant_status(plant_id),
+                "plant_energy_days": await api.async_get_plant_energy_days(
+                    plant_id,
+                    today.isoformat(),
+                    (today + timedelta(days=1)).isoformat(),
+                ),
+                "production_estimates": await api.async_get_production_estimates(
+                    plant_id
+                ),
+                "solar_times": await api.async_get_solar_times(
+                    plant_id, today.isoformat()
+                ),
+                "tracker_status": {
+                    str(tracker.id): await api.async_get_tracker_status(tracker.id)
+                    for tracker in trackers
+                },
+                "meter_status": await api.async_get_meter_status(plant.main_meter),
+            }
+        )
+
+
+def main() -> None:
+    """Record a fixture from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("access_token")
+    parser.add_argument("plant_id", type=int)
+    parser.add_argument(
+        "output", nargs="?", type=Path, default=FIXTURES / "recorded_plant.json"
+    )
+    args = parser.parse_args()
+
+    fixture = asyncio.run(async_record(args.access_token, args.plant_id))
+    args.output.write_text(
+        json.dumps(fixture, indent=2, default=str) + "\n", encoding="utf-8"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Tests of the forecast accuracy tracking."""
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+
+from custom_components.lumioo.accuracy import (
+    WINDOW_AFTERNOON,
+    WINDOW_MORNING,
+    ForecastAccuracy,
+)
+
+DAY = date(2023, 6, 21)
+
+
+def _noon(day: date) -> datetime:
+    """Return the solar noon of a day."""
+    return datetime(day.year, day.month, day.day, 12, tzinfo=timezone.utc)
+
+
+def _record_day(
+    accuracy: ForecastAccuracy,
+    day: date,
+    forecast: tuple[float, float],
+    actual: tuple[float, float],
+) -> None:
+    """Record the forecast and the production of the windows of a day."""
+    accuracy.record_forecast(day, WINDOW_MORNING, forecast[0], day_ahead=True)
+    accuracy.record_forecast(day, WINDOW_AFTERNOON, forecast[1], day_ahead=True)
+    noon = _noon(day)
+    accuracy.record_production(day, 0, noon - timedelta(hours=6), noon)
+    accuracy.record_production(day, actual[0], noon, noon)
+    accuracy.record_production(
+        day, actual[0] + actual[1], noon + timedelta(hours=8), noon
+    )
+
+
+def _next_day(accuracy: ForecastAccuracy, day: date) -> bool:
+    """Start the day after day, evaluating it."""
+    next_day = day + timedelta(days=1)
+    noon = _noon(next_day)
+    return accuracy.record_production(next_day, 0, noon - timedelta(hours=6), noon)
+
+
+def test_mape_and_bias() -> None:
+    """Test the errors of a day are evaluated once the next day starts."""
+    accuracy = ForecastAccuracy()
+    _record_day(accuracy, DAY, (5000, 10000), (4000, 12500))
+    assert accuracy.mape is None
+    assert accuracy.bias is None
+
+    assert _next_day(accuracy, DAY)
+
+    # Errors of +1000 (25%) in the morning and -2500 (20%) in the afternoon
+    assert accuracy.mape == 22.5
+    assert accuracy.bias == -750
+
+
+def test_same_day_forecast_kept_until_day_ahead() -> None:
+    """Test a day-ahead forecast replaces the first same-day one only."""
+    accuracy = ForecastAccuracy()
+
+    assert accuracy.record_forecast(DAY, WINDOW_MORNING, 5000, day_ahead=False)
+    assert not accuracy.record_forecast(DAY, WINDOW_MORNING, 6000, day_ahead=False)
+    assert accuracy.record_forecast(DAY, WINDOW_MORNING, 4000, day_ahead=True)
+    assert not accuracy.record_forecast(DAY, WINDOW_MORNING, 4000, day_ahead=True)
+    assert not accuracy.record_forecast(DAY, WINDOW_MORNING, None, day_ahead=True)
+
+    noon = _noon(DAY)
+    accuracy.record_production(DAY, 4000, noon, noon)
+    accuracy.record_production(DAY, 4000, noon + timedelta(hours=8), noon)
+    _next_day(accuracy, DAY)
+
+    # Only the morning window had a forecast, the afternoon produced nothing
+    assert accuracy.mape == 0.0
+    assert accuracy.bias == 0
+
+
+def test_day_without_morning_production_not_evaluated() -> None:
+    """Test a day missing the production at solar noon is not evaluated."""
+    accuracy = ForecastAccuracy()
+    accuracy.record_forecast(DAY, WINDOW_MORNING, 5000, day_ahead=True)
+    noon = _noon(DAY)
+    accuracy.record_production(DAY, 3000, noon - timedelta(hours=1), noon)
+
+    assert not _next_day(accuracy, DAY)
+    assert accuracy.mape is None
+
+
+def test_horizon() -> None:
+    """Test the statistics only cover the days of the horizon."""
+    accuracy = ForecastAccuracy(horizon=2)
+    day = DAY
+    for forecast in (20000, 10000, 10000):
+        _record_day(accuracy, day, (forecast, forecast), (10000, 10000))
+        _next_day(accuracy, day)
+        day += timedelta(days=1)
+
+    # The first day, with a 100% error, left the horizon
+    assert accuracy.mape == 0.0
+    assert accuracy.bias == 0
+
+
+def test_restore() -> None:
+    """Test the stored state restores the statistics and the tracked day."""
+    accuracy = ForecastAccuracy()
+    _record_day(accuracy, DAY, (5000, 10000), (4000, 12500))
+    _next_day(accuracy, DAY)
+    next_day = DAY + timedelta(days=1)
+    accuracy.record_forecast(next_day, WINDOW_MORNING, 6000, day_ahead=True)
+
+    restored = ForecastAccuracy()
+    restored.restore(accuracy.as_dict())
+
+    assert restored.as_dict() == accuracy.as_dict()
+    assert restored.mape == accuracy.mape
+    assert restored.bias == accuracy.bias
@@ -0,0 +1,72 @@
+"""Tests of the cross tracker production analysis."""
+from __future__ import annotations
+
+from custom_components.lumioo.analysis import TrackerAnalyzer
+from custom_components.lumioo.const import UNDERPERFORMANCE_WINDOW
+
+TRACKER_IDS = [str(tracker_id) for tracker_id in range(101, 111)]
+
+
+def _production(low: float | None = None) -> list[float | None]:
+    """Return the readings of a cycle, the last tracker producing low."""
+    production: list[float | None] = [1000.0 + index for index in range(10)]
+    production[-1] = low
+    return production
+
+
+def test_deviation_from_median() -> None:
+    """Test the deviation and wind deviation from the plant median."""
+    analyzer = TrackerAnalyzer(TRACKER_IDS)
+
+    analysis = analyzer.update(_production(500.0), [5.0] * 9 + [8.0])
+
+    # Median of 500 and 1000 to 1008
+    assert analysis.deviation["101"] == round(1000 / 1003.5 - 1, 3)
+    assert analysis.deviation["110"] == round(500 / 1003.5 - 1, 3)
+    assert analysis.wind_deviation["101"] == 0.0
+    assert analysis.wind_deviation["110"] == 3.0
+
+
+def test_underperforming_over_window() -> None:
+    """Test a tracker consistently producing less is flagged."""
+    analyzer = TrackerAnalyzer(TRACKER_IDS)
+    wind_speed = [5.0] * len(TRACKER_IDS)
+
+    for _ in range(UNDERPERFORMANCE_WINDOW):
+        analysis = analyzer.update(_production(500.0), wind_speed)
+    assert analysis.underperforming == frozenset({"110"})
+    assert analysis.zscore["110"] < 0
+
+    # The flag is cleared once the rolling window recovers
+    for _ in range(UNDERPERFORMANCE_WINDOW):
+        analysis = analyzer.update(_production(1009.0), wind_speed)
+    assert not analysis.underperforming
+
+
+def test_small_deviation_not_flagged() -> None:
+    """Test a tracker close to its neighbours is not flagged."""
+    analyzer = TrackerAnalyzer(TRACKER_IDS)
+    wind_speed = [5.0] * len(TRACKER_IDS)
+
+    for _ in range(UNDERPERFORMANCE_WINDOW):
+        analysis = analyzer.update(_production(950.0), wind_speed)
+
+    assert not analysis.underperforming
+
+
+def test_night_and_missing_readings() -> None:
+    """Test low plant production and missing readings give no deviation."""
+    analyzer = TrackerAnalyzer(TRACKER_IDS)
+
+    analysis = analyzer.update([10.0] * len(TRACKER_IDS), [None] * len(TRACKER_IDS))
+
+    assert set(analysis.deviation.values()) == {None}
+    assert set(analysis.zscore.values()) == {None}
+    assert set(analysis.wind_deviation.values()) == {None}
+    assert not analysis.underperforming
+
+    analysis = analyzer.update(_production(None), [5.0] * len(TRACKER_IDS))
+
+    assert analysis.deviation["110"] is None
+    assert analysis.deviation["101"] is not None
+    assert not analysis.underperforming
@@ -0,0 +1,56 @@
+"""Tests of the Lumioo binary sensors."""
+from __future__ import annotations
+
+from collections import Counter
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import STATE_OFF, STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.lumioo.const import COORDINATOR_TRACKERS, DATA, DOMAIN
+
+from .common import ReplayLumiooHubAPI
+
+
+@pytest.mark.parametrize("tracker_count", [3])
+async def test_underperforming_availability(
+    hass: HomeAssistant,
+    replay_api: ReplayLumiooHubAPI,
+    config_entry: MockConfigEntry,
+    state_writes: Counter[str],
+) -> None:
+    """Test the flag becomes unavailable when the trackers cannot be refreshed."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    data = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = data[COORDINATOR_TRACKERS]
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "binary_sensor",
+        DOMAIN,
+        f"lumioo {replay_api.tracker_ids[0]} trackers underperforming",
+    )
+    assert hass.states.get(entity_id).state == STATE_OFF
+    state_writes.clear()
+
+    with patch.object(
+        data[DATA], "update_data_trackers", side_effect=UpdateFailed("offline")
+    ):
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert hass.states.get(entity_id).state == STATE_UNAVAILABLE
+        assert state_writes[entity_id] == 1
+
+        # Unavailability is only written once
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert state_writes[entity_id] == 1
+
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == STATE_OFF
+    assert state_writes[entity_id] == 2
@@ -0,0 +1,182 @@
+"""Request and state write budgets of the Lumioo refresh cycles.
+
+A change adding requests or state writes to a refresh cycle must update the
+budgets below.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from datetime import timedelta
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.lumioo.const import (
+    DOMAIN,
+    DATA,
+    COORDINATOR_PLANT,
+    COORDINATOR_SOLAR,
+    COORDINATOR_TRACKERS,
+    COORDINATOR_METER,
+)
+from custom_components.lumioo.sensor import SOLAR_SENSORS, TRACKER_SENSORS
+
+from .common import ReplayLumiooHubAPI
+
+# Requests fetching the plant, trackers and meter details at setup
+SETUP_REQUESTS = 3
+PLANT_REQUESTS = 2
+# Sun events are cross checked with Lumioo on the first refresh of the day
+SOLAR_REQUESTS = 1
+SOLAR_CROSS_CHECK_REQUESTS = 1
+METER_REQUESTS = 1
+
+# Timestamp sensors enabled by default, the sun events only change once a day
+ENABLED_TIMESTAMP_SENSORS = {"sunrise", "sunset", "solar_noon"}
+
+COORDINATORS = (
+    COORDINATOR_PLANT,
+    COORDINATOR_SOLAR,
+    COORDINATOR_TRACKERS,
+    COORDINATOR_METER,
+)
+
+
+async def _async_setup(hass: HomeAssistant, entry: MockConfigEntry):
+    """Set up the entry and return its data."""
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return hass.data[DOMAIN][entry.entry_id]
+
+
+async def _async_refresh(hass: HomeAssistant, data, *coordinators: str) -> None:
+    """Run a refresh cycle of the coordinators."""
+    for coordinator in coordinators:
+        await data[coordinator].async_refresh()
+    await hass.async_block_till_done()
+
+
+@pytest.mark.parametrize("tracker_count", [1, 3, 50])
+async def test_setup_requests(
+    hass: HomeAssistant,
+    replay_api: ReplayLumiooHubAPI,
+    config_entry: MockConfigEntry,
+    tracker_count: int,
+) -> None:
+    """Test the requests issued to set up a plant."""
+    data = await _async_setup(hass, config_entry)
+    lumioo = data[DATA]
+
+    assert lumioo.request_counts == {
+        "plant": PLANT_REQUESTS,
+        "solar": SOLAR_REQUESTS + SOLAR_CROSS_CHECK_REQUESTS,
+        "trackers": tracker_count,
+        "meter": METER_REQUESTS,
+        "export": 0,
+    }
+    # Every request of a refresh cycle is accounted by the connector
+    assert sum(replay_api.calls.values()) == SETUP_REQUESTS + lumioo.request_total
+
+
+@pytest.mark.parametrize("tracker_count", [1, 3, 50])
+async def test_refresh_requests(
+    hass: HomeAssistant,
+    replay_api: ReplayLumiooHubAPI,
+    config_entry: MockConfigEntry,
+    tracker_count: int,
+) -> None:
+    """Test the requests issued by a refresh cycle."""
+    data = await _async_setup(hass, config_entry)
+    lumioo = data[DATA]
+    replay_api.calls.clear()
+    request_total = lumioo.request_total
+
+    await _async_refresh(hass, data, *COORDINATORS)
+
+    assert lumioo.request_counts == {
+        "plant": PLANT_REQUESTS,
+        "solar": SOLAR_REQUESTS,
+        "trackers": tracker_count,
+        "meter": METER_REQUESTS,
+        "export": 0,
+    }
+    assert sum(replay_api.calls.values()) == lumioo.request_total - request_total
+
+
+@pytest.mark.parametrize("tracker_count", [3, 50])
+async def test_unchanged_refresh_writes_no_state(
+    hass: HomeAssistant,
+    replay_api: ReplayLumiooHubAPI,
+    config_entry: MockConfigEntry,
+    state_writes: Counter[str],
+) -> None:
+    """Test a refresh returning the same data does not write any state."""
+    data = await _async_setup(hass, config_entry)
+    state_writes.clear()
+
+    await _async_refresh(hass, data, *COORDINATORS)
+
+    assert not state_writes
+
+
+@pytest.mark.parametrize("tracker_count", [3, 50])
+async def test_tracker_change_writes(
+    hass: HomeAssistant,
+    replay_api: ReplayLumiooHubAPI,
+    config_entry: MockConfigEntry,
+    state_writes: Counter[str],
+) -> None:
+    """Test a tracker reading change only writes the states of that tracker."""
+    data = await _async_setup(hass, config_entry)
+    state_writes.clear()
+
+    tracker_id = replay_api.tracker_ids[0]
+    status = replay_api.fixture["tracker_status"][str(tracker_id)]
+    replay_api.set_tracker_production(tracker_id, status["data"]["production"] + 50)
+    await _async_refresh(hass, data, COORDINATOR_TRACKERS)
+
+    assert 0 < sum(state_writes.values()) <= len(TRACKER_SENSORS)
+    assert set(state_writes.values()) == {1}
+
+
+@pytest.mark.parametrize("tracker_count", [3])
+async def test_sun_move_writes_elevation_only(
+    hass: HomeAssistant,
+    freezer,
+    replay_api: ReplayLumiooHubAPI,
+    config_entry: MockConfigEntry,
+    state_writes: Counter[str],
+) -> None:
+    """Test the sun moving only writes the state of the elevation sensor."""
+    data = await _async_setup(hass, config_entry)
+    state_writes.clear()
+
+    freezer.tick(timedelta(minutes=5))
+    await _async_refresh(hass, data, COORDINATOR_SOLAR)
+
+    assert len(SOLAR_SENSORS) > 1
+    assert dict(state_writes) == {"sensor.solar_forecast_sun_elevation": 1}
+
+
+@pytest.mark.parametrize("tracker_count", [3])
+async def test_poll_timestamp_sensors_disabled(
+    hass: HomeAssistant,
+    replay_api: ReplayLumiooHubAPI,
+    config_entry: MockConfigEntry,
+) -> None:
+    """Test the timestamp sensors changing on every poll are disabled by default."""
+    await _async_setup(hass, config_entry)
+
+    enabled_timestamps = {
+        entry.unique_id.rsplit(" ", 1)[-1]
+        for entry in er.async_entries_for_config_entry(
+            er.async_get(hass), config_entry.entry_id
+        )
+        if entry.original_device_class == SensorDeviceClass.TIMESTAMP
+        and not entry.disabled
+    }
+    assert enabled_timestamps == ENABLED_TIMESTAMP_SENSORS
@@ -0,0 +1,217 @@
+"""Tests of the Lumioo config flow and of the entries it creates."""
+from __future__ import annotations
+
+from collections.abc import Generator
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers import issue_registry as ir
+
+from custom_components.lumioo.config_flow import SOURCE_ADD_PLANT
+from custom_components.lumioo.const import CONF_PLANT_ID, CONF_PLANTS, DATA, DOMAIN
+
+from .common import ACCESS_TOKEN, PLANT_ID, ReplayLumiooHubAPI
+
+OTHER_PLANT_ID = 2181
+NEW_ACCESS_TOKEN = "new-access-token"
+
+
+@pytest.fixture
+def mock_setup_entry() -> Generator[AsyncMock, None, None]:
+    """Do not set up the entries created by the flows."""
+    with patch(
+        "custom_components.lumioo.async_setup_entry", return_value=True
+    ) as setup_entry:
+        yield setup_entry
+
+
+@pytest.fixture
+def two_plants(replay_api: ReplayLumiooHubAPI) -> ReplayLumiooHubAPI:
+    """Replay an account of two plants."""
+    plant = replay_api.fixture["plant"]
+    plants = {
+        PLANT_ID: plant,
+        OTHER_PLANT_ID: {**plant, "id": OTHER_PLANT_ID, "alias_installation": "Barn"},
+    }
+
+    async def async_get_plants():
+        return [SimpleNamespace(**plant) for plant in plants.values()]
+
+    async def async_get_plant(plant_id):
+        return SimpleNamespace(**plants[plant_id])
+
+    replay_api.async_get_plants = async_get_plants
+    replay_api.async_get_plant = async_get_plant
+    return replay_api
+
+
+async def _async_start_user_flow(hass: HomeAssistant, access_token: str):
+    """Start a user flow and submit the access token."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "user"
+    return await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"access_token": access_token}
+    )
+
+
+async def test_single_plant(
+    hass: HomeAssistant, replay_api: ReplayLumiooHubAPI, mock_setup_entry: AsyncMock
+) -> None:
+    """Test the plant of a single plant account is added without selection."""
+    result = await _async_start_user_flow(hass, ACCESS_TOKEN)
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["title"] == "Home"
+    assert result["data"] == {"access_token": ACCESS_TOKEN, CONF_PLANT_ID: PLANT_ID}
+    assert result["result"].unique_id == str(PLANT_ID)
+
+
+async def test_select_plants(
+    hass: HomeAssistant, two_plants: ReplayLumiooHubAPI, mock_setup_entry: AsyncMock
+) -> None:
+    """Test each selected plant gets its own entry."""
+    result = await _async_start_user_flow(hass, ACCESS_TOKEN)
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "plants"
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_PLANTS: [str(PLANT_ID), str(OTHER_PLANT_ID)]}
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    entries = {
+        entry.unique_id: entry for entry in hass.config_entries.async_entries(DOMAIN)
+    }
+    assert set(entries) == {str(PLANT_ID), str(OTHER_PLANT_ID)}
+    other = entries[str(OTHER_PLANT_ID)]
+    assert other.title == "Barn"
+    assert other.source == SOURCE_ADD_PLANT
+    assert other.data == {"access_token": ACCESS_TOKEN, CONF_PLANT_ID: OTHER_PLANT_ID}
+
+
+async def test_no_plant_selected(
+    hass: HomeAssistant, two_plants: ReplayLumiooHubAPI, mock_setup_entry: AsyncMock
+) -> None:
+    """Test at least one plant must be selected."""
+    result = await _async_start_user_flow(hass, ACCESS_TOKEN)
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_PLANTS: []}
+    )
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"base": "no_plant_selected"}
+
+
+async def test_configured_plants_not_offered(
+    hass: HomeAssistant,
+    two_plants: ReplayLumiooHubAPI,
+    config_entry: MockConfigEntry,
+    mock_setup_entry: AsyncMock,
+) -> None:
+    """Test the plants already added are not offered again."""
+    result = await _async_start_user_flow(hass, ACCESS_TOKEN)
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["result"].unique_id == str(OTHER_PLANT_ID)
+
+
+async def test_token_update(
+    hass: HomeAssistant,
+    replay_api: ReplayLumiooHubAPI,
+    config_entry: MockConfigEntry,
+    mock_setup_entry: AsyncMock,
+) -> None:
+    """Test adding a plant again updates the access token of its entry."""
+    result = await _async_start_user_flow(hass, NEW_ACCESS_TOKEN)
+    await hass.async_block_till_done()
+
+    assert result["type"] == FlowResultType.ABORT
+    assert result["reason"] == "token_updated"
+    assert config_entry.data["access_token"] == NEW_ACCESS_TOKEN
+    assert len(hass.config_entries.async_entries(DOMAIN)) == 1
+
+    result = await _async_start_user_flow(hass, NEW_ACCESS_TOKEN)
+
+    assert result["type"] == FlowResultType.ABORT
+    assert result["reason"] == "no_plants"
+
+
+async def test_cannot_connect(
+    hass: HomeAssistant, replay_api: ReplayLumiooHubAPI, mock_setup_entry: AsyncMock
+) -> None:
+    """Test the form is shown again when Lumioo cannot be reached."""
+    with patch.object(replay_api, "async_get_plants", side_effect=RuntimeError):
+        result = await _async_start_user_flow(hass, ACCESS_TOKEN)
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"base": "cannot_connect"}
+
+
+async def test_legacy_entry_stores_plant(
+    hass: HomeAssistant, replay_api: ReplayLumiooHubAPI
+) -> None:
+    """Test an entry created before plant selection records its plant."""
+    entry = MockConfigEntry(domain=DOMAIN, data={"access_token": ACCESS_TOKEN})
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is config_entries.ConfigEntryState.LOADED
+    assert entry.unique_id == str(PLANT_ID)
+    assert entry.data[CONF_PLANT_ID] == PLANT_ID
+
+
+async def test_legacy_duplicate_entry(
+    hass: HomeAssistant, replay_api: ReplayLumiooHubAPI, config_entry: MockConfigEntry
+) -> None:
+    """Test a legacy entry of a plant already added raises a repair issue."""
+    duplicate = MockConfigEntry(
+        domain=DOMAIN, title="Old", data={"access_token": ACCESS_TOKEN}
+    )
+    duplicate.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(duplicate.entry_id)
+    await hass.async_block_till_done()
+
+    assert config_entry.state is config_entries.ConfigEntryState.LOADED
+    assert duplicate.state is config_entries.ConfigEntryState.SETUP_ERROR
+    assert duplicate.unique_id is None
+    issue_id = f"duplicate_plant_{duplicate.entry_id}"
+    issue = ir.async_get(hass).async_get_issue(DOMAIN, issue_id)
+    assert issue is not None
+    assert issue.translation_key == "duplicate_plant"
+
+    # The entry is left for the user to remove
+    assert await hass.config_entries.async_remove(duplicate.entry_id)
+    await hass.async_block_till_done()
+
+    assert ir.async_get(hass).async_get_issue(DOMAIN, issue_id) is None
+    assert config_entry.state is config_entries.ConfigEntryState.LOADED
+
+
+async def test_unload_closes_connector(
+    hass: HomeAssistant, replay_api: ReplayLumiooHubAPI, config_entry: MockConfigEntry
+) -> None:
+    """Test unloading an entry closes the connection pool of its plant."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    session = hass.data[DOMAIN][config_entry.entry_id][DATA]._session
+    assert not session.closed
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert session.closed
+    assert config_entry.entry_id not in hass.data[DOMAIN]
@@ -0,0 +1,81 @@
+"""Tests of the refresh deadline of the Lumioo requests."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+
+from custom_components.lumioo.const import (
+    COORDINATOR_TRACKERS,
+    DATA,
+    DOMAIN,
+    REFRESH_DEADLINE,
+)
+
+from .common import ReplayLumiooHubAPI
+
+
+@pytest.mark.parametrize("tracker_count", [4])
+async def test_late_and_failed_trackers_stale(
+    hass: HomeAssistant,
+    freezer,
+    replay_api: ReplayLumiooHubAPI,
+    config_entry: MockConfigEntry,
+) -> None:
+    """Test a hung and a failed tracker request only make their tracker stale."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    data = hass.data[DOMAIN][config_entry.entry_id]
+    lumioo = data[DATA]
+    hung_id, failed_id, *other_ids = replay_api.tracker_ids
+
+    async_get_tracker_status = replay_api.async_get_tracker_status
+    hung = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def _async_get_tracker_status(tracker_id):
+        if tracker_id == hung_id:
+            hung.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        if tracker_id == failed_id:
+            raise aiohttp.ClientConnectionError("Connection reset")
+        return await async_get_tracker_status(tracker_id)
+
+    for tracker_id in replay_api.tracker_ids:
+        replay_api.set_tracker_production(tracker_id, 321)
+    # The hung request outlives the deadline instead of its own timeout
+    with patch(
+        "custom_components.lumioo.ENDPOINT_TIMEOUT", REFRESH_DEADLINE * 2
+    ), patch.object(replay_api, "async_get_tracker_status", _async_get_tracker_status):
+        refresh = hass.async_create_task(data[COORDINATOR_TRACKERS].async_refresh())
+        await hung.wait()
+        freezer.tick(timedelta(seconds=REFRESH_DEADLINE + 1))
+        async_fire_time_changed(hass)
+        await refresh
+        await hass.async_block_till_done()
+
+    assert data[COORDINATOR_TRACKERS].last_update_success
+    # The hung request was cancelled at the deadline
+    assert cancelled.is_set()
+    for tracker_id in (hung_id, failed_id):
+        assert lumioo.data["trackers"][str(tracker_id)].stale == {"status"}
+        state = hass.states.get(f"sensor.tracker_{tracker_id}_production")
+        assert state.state == STATE_UNAVAILABLE
+    for tracker_id in other_ids:
+        assert not lumioo.data["trackers"][str(tracker_id)].stale
+        state = hass.states.get(f"sensor.tracker_{tracker_id}_production")
+        assert state.state == "321"
@@ -0,0 +1,169 @@
+"""Tests of the Lumioo services."""
+from __future__ import annotations
+
+import csv
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+
+from custom_components.lumioo.const import (
+    DATA,
+    DATASET_ENERGY_DAYS,
+    DEBOUNCE_COOLDOWN,
+    DOMAIN,
+    EXPORT_DIRECTORY,
+)
+from custom_components.lumioo.services import SERVICE_EXPORT, SERVICE_REFRESH
+
+from .common import PLANT_ID, ReplayLumiooHubAPI
+
+
+async def _async_setup(hass: HomeAssistant, entry: MockConfigEntry) -> None:
+    """Set up the entry."""
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def _async_fire_cooldown(hass: HomeAssistant, freezer) -> None:
+    """Let the refresh cooldown elapse."""
+    freezer.tick(timedelta(seconds=DEBOUNCE_COOLDOWN + 1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.parametrize("tracker_count", [3])
+async def test_refresh_debounce(
+    hass: HomeAssistant,
+    freezer,
+    replay_api: ReplayLumiooHubAPI,
+    config_entry: MockConfigEntry,
+) -> None:
+    """Test bursts of refresh calls are combined into one refresh."""
+    await _async_setup(hass, config_entry)
+    device_registry = dr.async_get(hass)
+    plant = device_registry.async_get_device(identifiers={(DOMAIN, PLANT_ID)})
+    trackers = [
+        device_registry.async_get_device(identifiers={(DOMAIN, tracker_id)})
+        for tracker_id in replay_api.tracker_ids
+    ]
+    replay_api.calls.clear()
+
+    for device in trackers:
+        await hass.services.async_call(
+            DOMAIN, SERVICE_REFRESH, {"device_id": device.id}, blocking=True
+        )
+    # Refreshes only run once the cooldown elapsed
+    assert not replay_api.calls
+
+    await _async_fire_cooldown(hass, freezer)
+
+    assert set(replay_api.calls) == {"tracker_status"}
+    assert replay_api.calls["tracker_status"] == len(trackers)
+
+    replay_api.calls.clear()
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_REFRESH,
+        {"device_id": [plant.id, trackers[0].id]},
+        blocking=True,
+    )
+    await hass.services.async_call(
+        DOMAIN, SERVICE_REFRESH, {"device_id": plant.id}, blocking=True
+    )
+    await _async_fire_cooldown(hass, freezer)
+
+    # One refresh of every subsystem of the plant
+    assert replay_api.calls["tracker_status"] == len(trackers)
+    assert replay_api.calls["meter_status"] == 1
+    assert replay_api.calls["plant_status"] == 1
+
+
+@pytest.fixture
+def export_directory(hass: HomeAssistant, tmp_path: Path) -> Path:
+    """Use a temporary configuration directory for the exports."""
+    hass.config.config_dir = str(tmp_path)
+    return tmp_path / EXPORT_DIRECTORY
+
+
+async def _async_export(hass: HomeAssistant, entry: MockConfigEntry) -> None:
+    """Export the energy days of June 2023 to june.csv."""
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_EXPORT,
+        {
+            "config_entry_id": entry.entry_id,
+            "dataset": DATASET_ENERGY_DAYS,
+            "start_date": "2023-05-20",
+            "end_date": "2023-06-30",
+            "filename": "june.csv",
+        },
+        blocking=True,
+    )
+
+
+async def test_export_energy_days(
+    hass: HomeAssistant,
+    replay_api: ReplayLumiooHubAPI,
+    config_entry: MockConfigEntry,
+    export_directory: Path,
+) -> None:
+    """Test the energy days are exported page by page through the connector."""
+    await _async_setup(hass, config_entry)
+    lumioo = hass.data[DOMAIN][config_entry.entry_id][DATA]
+    replay_api.calls.clear()
+    request_total = lumioo.request_total
+
+    await _async_export(hass, config_entry)
+
+    with open(export_directory / "june.csv", encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+    assert [row["day"] for row in rows] == ["2023-06-21"]
+    assert rows[0]["production"] == "8450"
+    # The range spans two pages
+    assert replay_api.calls["plant_energy_days"] == 2
+    assert lumioo.request_counts["export"] == 2
+    assert lumioo.request_total - request_total == 2
+
+    # Existing files are not overwritten
+    with pytest.raises(HomeAssistantError, match="already exists"):
+        await _async_export(hass, config_entry)
+
+
+async def test_export_failure_removes_file(
+    hass: HomeAssistant,
+    replay_api: ReplayLumiooHubAPI,
+    config_entry: MockConfigEntry,
+    export_directory: Path,
+) -> None:
+    """Test a failed export leaves no partial file behind."""
+    await _async_setup(hass, config_entry)
+    async_get_plant_energy_days = replay_api.async_get_plant_energy_days
+    pages = 0
+
+    async def _async_get_plant_energy_days(*args):
+        nonlocal pages
+        pages += 1
+        if pages == 2:
+            raise RuntimeError("Service unavailable")
+        return await async_get_plant_energy_days(*args)
+
+    with patch.object(
+        replay_api, "async_get_plant_energy_days", _async_get_plant_energy_days
+    ), pytest.raises(HomeAssistantError, match="Unable to fetch the energy days"):
+        await _async_export(hass, config_entry)
+
+    assert not (export_directory / "june.csv").exists()
+
+    # The export can be run again
+    await _async_export(hass, config_entry)
+    assert (export_directory / "june.csv").exists()
@@ -0,0 +1,57 @@
+"""Tests of the local sun position computation."""
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+
+from astral import LocationInfo
+from astral.sun import elevation, noon, sunrise, sunset
+import pytest
+
+from custom_components.lumioo.solar_position import solar_elevation, solar_times
+
+# Sunrise and sunset are accurate to about a minute between the polar circles,
+# the sun crossing the horizon at a shallow angle near them
+TOLERANCE = timedelta(seconds=90)
+
+LOCATIONS = [
+    (32.87336, -117.22743),  # San Diego, the Home Assistant test location
+    (48.85, 2.35),
+    (-33.87, 151.21),
+    (64.15, -21.94),
+]
+DAYS = [date(2023, 3, 20), date(2023, 6, 21), date(2023, 12, 21)]
+
+
+@pytest.mark.parametrize(("latitude", "longitude"), LOCATIONS)
+@pytest.mark.parametrize("day", DAYS)
+def test_solar_times(day: date, latitude: float, longitude: float) -> None:
+    """Test the sun events match the ones computed by astral."""
+    observer = LocationInfo(latitude=latitude, longitude=longitude).observer
+
+    times = solar_times(day, latitude, longitude)
+
+    assert abs(times.sunrise - sunrise(observer, day)) < TOLERANCE
+    assert abs(times.sunset - sunset(observer, day)) < TOLERANCE
+    assert abs(times.solar_noon - noon(observer, day)) < TOLERANCE
+
+
+def test_solar_times_polar_day_and_night() -> None:
+    """Test the sun does not rise nor set during polar day and night."""
+    for day in (date(2023, 6, 21), date(2023, 12, 21)):
+        times = solar_times(day, 80.0, 15.0)
+
+        assert times.sunrise is None
+        assert times.sunset is None
+        assert times.solar_noon.date() == day
+
+
+@pytest.mark.parametrize(("latitude", "longitude"), LOCATIONS)
+def test_solar_elevation(latitude: float, longitude: float) -> None:
+    """Test the sun elevation matches the one computed by astral."""
+    observer = LocationInfo(latitude=latitude, longitude=longitude).observer
+    moment = datetime(2023, 6, 21, tzinfo=timezone.utc)
+    for _ in range(24):
+        assert solar_elevation(moment, latitude, longitude) == pytest.approx(
+            elevation(observer, moment, with_refraction=False), abs=0.1
+        )
+        moment += timedelta(hours=1)